@@ -1,21 +1,20 @@
 import streamlit as st
-import pandas as pd
-import base64
-import time
 import datetime
-import io
-import re
 import os
-import json
 import random
-import sqlite3
-import pdfplumber
-import plotly.express as px
-from pdfminer.high_level import extract_text
-from pdfminer.pdfpage import PDFPage # Import PDFPage for accurate page counting
-from streamlit_tags import st_tags
 from dotenv import load_dotenv
 import streamlit.components.v1 as components
+import metrics
+import admin_dashboard
+import preview
+import render
+from app_common import analyze_upload, get_analysis, get_skill_taxonomy, start_extract_workers, start_metrics_exporter
+from storage import get_storage
+from resume_analysis import (
+    recommend_skills_and_courses,
+    calculate_resume_score, determine_candidate_level
+)
+from field_classifier import DEFAULT_FIELD, get_field_classifier
 
 load_dotenv() # Load variables from .env file
 
@@ -28,9 +27,8 @@ st.set_page_config(
 
 # --- LOAD CSS AND JAVASCRIPT ---
 def load_css():
-    # Load completely new CSS design
-    with open(os.path.join(os.path.dirname(__file__), "new_style.css")) as f:
-        st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+    # new_style.css is read once per process; see render.py
+    st.markdown(render.style_html(), unsafe_allow_html=True)
 
 # Load custom CSS
 load_css()
@@ -39,307 +37,63 @@ load_css()
 
 # Function to inject custom JavaScript
 def inject_js(js_code):
-    components.html(
-        f"""
-        <script type="text/javascript">
-        // Wrap in a function to avoid global scope issues
-        (function() {{
-            {js_code}
-            
-            // Call the initialization function
-            document.addEventListener('DOMContentLoaded', function() {{
-                initializeApp();
-            }});
-            
-            // Also try to run it immediately in case DOM is already loaded
-            try {{
-                initializeApp();
-            }} catch(e) {{
-                console.log('Will initialize on DOMContentLoaded');
-            }}
-        }})();
-        </script>
-        """,
-        height=0,
-    )
+    # The same code renders the same cached HTML, so reruns keep the existing iframe
+    components.html(render.script_html(js_code), height=0)
 
 # --- SQLITE DATABASE SETUP ---
 @st.cache_resource
-def init_db_connection():
-    """Initializes a connection to SQLite database."""
+def init_storage():
+    """Opens the storage backend (SQLite unless SRA_DB_BACKEND says otherwise)."""
     try:
-        db_path = os.path.join(os.path.dirname(__file__), 'resume_analyzer.db')
-        connection = sqlite3.connect(db_path, check_same_thread=False)
-        connection.row_factory = sqlite3.Row  # This makes rows behave like dictionaries
-        return connection
+        storage = get_storage(os.environ.get('SRA_DB_BACKEND', 'sqlite'))
+        storage.setup()
+        return storage
     except Exception as e:
         st.sidebar.warning(f"DB Connection failed: {e}. Data will not be saved.")
         return None
 
-def setup_database(connection):
-    """Sets up the necessary database and table if they don't exist."""
-    if connection:
-        cursor = connection.cursor()
-        try:
-            # SQLite doesn't need CREATE DATABASE command - database is created when connecting
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_data (
-                    ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    Name TEXT NOT NULL,
-                    Email_ID TEXT NOT NULL,
-                    resume_score TEXT NOT NULL,
-                    Timestamp TEXT NOT NULL,
-                    Page_no TEXT NOT NULL,
-                    Predicted_Field TEXT NOT NULL,
-                    User_level TEXT NOT NULL,
-                    Actual_skills TEXT NOT NULL,
-                    Recommended_skills TEXT NOT NULL,
-                    Recommended_courses TEXT NOT NULL,
-                    UNIQUE(Name, Email_ID)
-                );
-            """)
-            connection.commit()
-        finally:
-            cursor.close()
-def insert_data(connection, name, email, res_score, timestamp, no_of_pages, reco_field, cand_level, skills, recommended_skills, courses):
+def insert_data(storage, name, email, res_score, timestamp, no_of_pages, reco_field, cand_level, skills, recommended_skills, courses):
     """Inserts or updates candidate data in the database."""
-    if connection:
-        cursor = connection.cursor()
-        try:
-            # Check if the record already exists
-            cursor.execute("SELECT ID FROM user_data WHERE Name = ? AND Email_ID = ?", (name, email))
-            data = cursor.fetchone()
-
-            if data:
-                # Record exists, so we can update it (optional)
-                update_sql = """
-                    UPDATE user_data SET
-                        resume_score = ?, Timestamp = ?, Page_no = ?, Predicted_Field = ?,
-                        User_level = ?, Actual_skills = ?, Recommended_skills = ?, Recommended_courses = ?
-                    WHERE ID = ?
-                """
-                update_values = (str(res_score), timestamp, str(no_of_pages), reco_field, cand_level, str(skills), str(recommended_skills), str(courses), data[0])
-                cursor.execute(update_sql, update_values)
-                st.success("Resume analysis updated successfully!") # Inform user of update
-            else:
-                # Record does not exist, insert a new one
-                insert_sql = """
-                    INSERT INTO user_data (Name, Email_ID, resume_score, Timestamp, Page_no, Predicted_Field, User_level, Actual_skills, Recommended_skills, Recommended_courses)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                rec_values = (name, email, str(res_score), timestamp, str(no_of_pages), reco_field, cand_level, str(skills), str(recommended_skills), str(courses))
-                cursor.execute(insert_sql, rec_values)
-                st.success("Resume analysis saved successfully!") # Inform user of new save
-
-            connection.commit()
-        finally:
-            cursor.close()
-
-# --- HELPER FUNCTIONS ---
-def load_recommendation_data(file_path='courses.json'):
-    """Loads course/skill recommendations from JSON, with safe fallback defaults."""
-    default_data = {
-        "Data Science": {
-            "courses": [
-                ["Machine Learning Crash Course by Google [Free]", "https://developers.google.com/machine-learning/crash-course"],
-                ["Machine Learning A-Z by Udemy", "https://www.udemy.com/course/machinelearning/"],
-                ["Machine Learning by Andrew NG", "https://www.coursera.org/learn/machine-learning"],
-                ["Data Scientist Master Program of Simplilearn (IBM)", "https://www.simplilearn.com/big-data-and-analytics/senior-data-scientist-masters-program-training"],
-                ["Data Science Foundations: Fundamentals by LinkedIn", "https://www.linkedin.com/learning/data-science-foundations-fundamentals-5"]
-            ],
-            "skills": ["Data Visualization", "Predictive Analysis", "Statistical Modeling", "Data Mining", "ML Algorithms", "Keras", "Pytorch", "Scikit-learn", "Tensorflow", "Flask", "Streamlit"]
-        },
-        "Web Development": {
-            "courses": [
-                ["Django Crash course [Free]", "https://youtu.be/e1IyzVyrLSU"],
-                ["Python and Django Full Stack Web Developer Bootcamp", "https://www.udemy.com/course/python-and-django-full-stack-web-developer-bootcamp"],
-                ["React Crash Course [Free]", "https://youtu.be/Dorf8i6lCuk"]
-            ],
-            "skills": ["React", "Django", "Node JS", "React JS", "Javascript", "Angular JS", "Flask"]
-        },
-        "Android Development": {
-            "courses": [
-                ["Android Development for Beginners [Free]", "https://youtu.be/fis26HvvDII"],
-                ["Android App Development Specialization", "https://www.coursera.org/specializations/android-app-development"],
-                ["Complete Android Developer Course", "https://www.udemy.com/course/complete-android-n-developer-course/"]
-            ],
-            "skills": ["Java", "Kotlin", "XML", "Android Studio", "Firebase", "SQLite", "Material Design"]
-        },
-        "IOS Development": {
-            "courses": [
-                ["iOS App Development with Swift", "https://www.coursera.org/specializations/app-development"],
-                ["Complete iOS Developer Course", "https://www.udemy.com/course/ios-13-app-development-bootcamp/"]
-            ],
-            "skills": ["Swift", "Objective-C", "Xcode", "Core Data", "UIKit", "SwiftUI"]
-        },
-        "UI-UX Development": {
-            "courses": [
-                ["Google UX Design Professional Certificate", "https://www.coursera.org/professional-certificates/google-ux-design"],
-                ["UI/UX Design Specialization", "https://www.coursera.org/specializations/ui-ux-design"]
-            ],
-            "skills": ["Figma", "Adobe XD", "Sketch", "Prototyping", "User Research", "Wireframing", "Visual Design"]
-        }
-    }
-    
-    try:
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-                return data
-        else:
-            # Create the file with default data
-            with open(file_path, 'w') as file:
-                json.dump(default_data, file, indent=4)
-            return default_data
-    except Exception as e:
-        st.warning(f"Could not load recommendation data: {e}. Using defaults.")
-        return default_data
-
-def pdf_reader(file):
-    """Extracts text from PDF using pdfplumber for better accuracy."""
-    try:
-        text = ""
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
-    except Exception as e:
-        st.error(f"Error reading PDF: {e}")
-        return ""
-
-def count_pdf_pages(file):
-    """Counts the number of pages in a PDF file."""
-    try:
-        with pdfplumber.open(file) as pdf:
-            return len(pdf.pages)
-    except Exception as e:
-        st.error(f"Error counting PDF pages: {e}")
-        return 0
-
-def parse_resume(text):
-    """Parses resume text and extracts relevant information with improved regex."""
-    if not text.strip():
-        return None
-    
-    # Initialize data structure
-    resume_data = {
-        'name': 'Not Found',
-        'email': 'Not Found',
-        'mobile_number': 'Not Found',
-        'skills': [],
-    }
-    
-    # --- 1. Improved Name Extraction ---
-    # Try to find a line with 2-3 words that is likely a name
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    for line in lines[:5]:  # Check the first 5 lines
-        if 2 <= len(line.split()) <= 4 and not re.search(r'\d|@|http|:|www', line, re.IGNORECASE):
-            resume_data['name'] = line
-            break
-            
-    # --- 2. Improved Email Extraction ---
-    # A robust regex for finding email addresses
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        resume_data['email'] = email_match.group(0)
-    
-    # --- 3. Improved Mobile Number Extraction ---
-    # A powerful regex that handles various formats (e.g., +91, (xxx), xxx-xxx-xxxx)
-    phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4,}'
-    phone_match = re.search(phone_pattern, text)
-    if phone_match:
-        # Clean up the found number by removing non-digit characters
-        resume_data['mobile_number'] = re.sub(r'\D', '', phone_match.group(0))
-
-    # --- 4. Skill Extraction (remains the same) ---
-    skill_keywords = [
-        'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'express',
-        'django', 'flask', 'spring', 'hibernate', 'mysql', 'postgresql', 'mongodb',
-        'html', 'css', 'bootstrap', 'jquery', 'php', 'laravel', 'codeigniter',
-        'machine learning', 'data science', 'artificial intelligence', 'deep learning',
-        'tensorflow', 'keras', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-        'git', 'github', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-        'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native',
-        'figma', 'adobe', 'photoshop', 'illustrator', 'sketch', 'ui', 'ux'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = {skill.title() for skill in skill_keywords if skill in text_lower}
-    resume_data['skills'] = sorted(list(found_skills))
-    
-    return resume_data
+    with metrics.timed('insert_data'):
+        status = storage.save(dict(
+            name=name, email=email, res_score=res_score, timestamp=timestamp, no_of_pages=no_of_pages,
+            reco_field=reco_field, cand_level=cand_level, skills=skills,
+            recommended_skills=recommended_skills, courses=courses
+        ))
+    if status == 'updated':
+        st.success("Resume analysis updated successfully!") # Inform user of update
+    elif status:
+        st.success("Resume analysis saved successfully!") # Inform user of save
 
-def recommend_skills_and_courses(skills, field):
-    """Recommends skills and courses based on detected field."""
-    recommendation_data = load_recommendation_data()
-    
-    if field in recommendation_data:
-        recommended_skills = recommendation_data[field]['skills']
-        courses = recommendation_data[field]['courses']
-        
-        # Filter out skills already present
-        missing_skills = [skill for skill in recommended_skills if skill.lower() not in [s.lower() for s in skills]]
-        
-        return missing_skills[:10], courses[:5]  # Limit recommendations
-    
-    return [], []
-
-def predict_field(skills):
-    """Predicts the field based on skills."""
-    skill_text = ' '.join(skills).lower()
-    
-    # Define field keywords
-    field_keywords = {
-        'Data Science': ['python', 'machine learning', 'data', 'pandas', 'numpy', 'tensorflow', 'keras', 'scikit-learn'],
-        'Web Development': ['html', 'css', 'javascript', 'react', 'angular', 'node', 'django', 'flask', 'php'],
-        'Android Development': ['android', 'java', 'kotlin', 'xml'],
-        'IOS Development': ['ios', 'swift', 'objective-c', 'xcode'],
-        'UI-UX Development': ['ui', 'ux', 'figma', 'adobe', 'sketch', 'design']
-    }
-    
-    field_scores = {}
-    for field, keywords in field_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in skill_text)
-        field_scores[field] = score
-    
-    if field_scores and max(field_scores.values()) > 0:
-        return max(field_scores, key=field_scores.get)
-    
-    return "General"
-
-def calculate_resume_score(resume_data):
-    """Calculates a resume score based on various factors."""
-    score = 0
-    
-    # Basic information (30 points)
-    if resume_data.get('name'): score += 10
-    if resume_data.get('email'): score += 10
-    if resume_data.get('mobile_number'): score += 10
-    
-    # Skills (40 points)
-    skill_count = len(resume_data.get('skills', []))
-    if skill_count >= 10: score += 40
-    elif skill_count >= 7: score += 30
-    elif skill_count >= 5: score += 20
-    elif skill_count >= 3: score += 10
-    
-    # Additional factors (30 points)
-    # This is a simplified scoring system
-    score += min(30, skill_count * 2)
-    
-    return min(100, score)  # Cap at 100
-
-def determine_candidate_level(score, skills_count):
-    """Determines candidate level based on score and skills."""
-    if score >= 80 and skills_count >= 8:
-        return "Experienced"
-    elif score >= 60 and skills_count >= 5:
-        return "Intermediate"
+@metrics.timed('render')
+def build_result_page(analysis, taxonomy):
+    """Renders the parts of the results page that depend only on the analysis,
+    together with the field, score and level they show. Runs in the analysis
+    job, so it is timed with the rest of the pipeline."""
+    resume_data = analysis['resume_data']
+    resume_score = calculate_resume_score(resume_data)
+    # Ranked fields weighted by how often each skill occurs
+    with metrics.timed('predict_field'):
+        field_labels = get_field_classifier(taxonomy).labels(resume_data['skill_counts'])
+    predicted_field = field_labels[0][0] if field_labels else DEFAULT_FIELD
+    field_text = predicted_field
+    if len(field_labels) > 1:
+        field_text += f" (also: {', '.join(field for field, _ in field_labels[1:])})"
+    if resume_data['skills']:
+        skills_html = render.INFO_CARD.format(body=render.skill_tags(tuple(resume_data['skills'])))
     else:
-        return "Fresher"
+        skills_html = '<div class="info-card warning-card">No specific technical skills detected. Consider adding more technical skills to your resume.</div>'
+    return {
+        'predicted_field': predicted_field,
+        'resume_score': resume_score,
+        'candidate_level': determine_candidate_level(resume_score, len(resume_data['skills'])),
+        'hello': render.hello_card(resume_data['name']),
+        'email': render.labelled_card('📧 Email', resume_data['email']),
+        'mobile': render.labelled_card('📱 Mobile', resume_data['mobile_number']),
+        'pages': render.labelled_card('📄 Pages', resume_data['no_of_pages']),
+        'skills': skills_html,
+        'field': render.labelled_card('🎯 Predicted Field', field_text, 'success-card'),
+    }
 
 # --- MAIN APPLICATION ---
 def main():
@@ -352,10 +106,11 @@ def main():
     """, unsafe_allow_html=True)
     
     # Initialize database
-    connection = init_db_connection()
-    if connection:
-        setup_database(connection)
-        st.sidebar.success("✅ Database connected (SQLite)")
+    storage = init_storage()
+    start_metrics_exporter()
+    start_extract_workers()
+    if storage:
+        st.sidebar.success(f"✅ Database connected ({storage.label})")
     
     # Sidebar with custom styling
     st.sidebar.markdown('<div class="app-header"><h2>User Selection</h2></div>', unsafe_allow_html=True)
@@ -364,9 +119,7 @@ def main():
     choice = st.sidebar.selectbox("Choose your role:", activities)
 
     # Inject JavaScript for UI enhancements
-    with open(os.path.join(os.path.dirname(__file__), "script.js"), 'r') as file:
-        js_content = file.read()
-        inject_js(js_content)
+    inject_js(render.asset('script.js'))
 
     if choice == 'Normal User':
         # --- USER INTERFACE ---
@@ -389,9 +142,6 @@ def main():
         st.markdown('</div>', unsafe_allow_html=True)
         
         if pdf_file is not None:
-            # Create a persistent in-memory copy for multiple reads
-            pdf_bytes = io.BytesIO(pdf_file.getvalue())
-            
             # Display the PDF and analyze it
             col1, col2 = st.columns([3, 5])
             
@@ -399,61 +149,44 @@ def main():
                 st.markdown('<div class="main-card">', unsafe_allow_html=True)
                 st.markdown('<h2 class="app-header">Resume Preview</h2>', unsafe_allow_html=True)
                 
-                # Display the PDF with custom styling
-                base64_pdf = base64.b64encode(pdf_bytes.read()).decode('utf-8')
-                pdf_display = f'<div class="resume-display"><iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="800" type="application/pdf"></iframe></div>'
-                st.markdown(pdf_display, unsafe_allow_html=True)
+                # Small files inline, large ones as cached page thumbnails (see preview.py)
+                preview.show_preview(pdf_file.getvalue())
                 st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Rewind after preview read
-                pdf_bytes.seek(0)
 
             with col2:
                 # --- RESUME ANALYSIS ---
                 st.markdown('<div class="main-card">', unsafe_allow_html=True)
                 st.markdown('<h2 class="app-header">Resume Analysis</h2>', unsafe_allow_html=True)
                 
-                # Show loading animation
-                with st.spinner("Analyzing your resume..."):
-                    # Ensure stream at start before text extraction
-                    pdf_bytes.seek(0)
-                    resume_text = pdf_reader(pdf_bytes)
-                    resume_data = parse_resume(resume_text)
-                    
-                    # Accurately count pages using the new function
-                    # Rewind again before counting pages
-                    pdf_bytes.seek(0)
-                    page_count = count_pdf_pages(pdf_bytes)
-                    resume_data['no_of_pages'] = page_count
+                # Analysis runs in the background; reruns with the same upload are served from the cache
+                analysis = get_analysis(pdf_file.getvalue(), 'App_SQLite', build_result_page)
+                resume_data = analysis['resume_data'] if analysis else None
 
 
                 if resume_data:
+                    # Fragments, score and level depend only on the analysis, so they are built once per result
+                    result_page = analysis['page']
+                    predicted_field = result_page['predicted_field']
+                    resume_score = result_page['resume_score']
+                    candidate_level = result_page['candidate_level']
+
                     # Welcome message with animation
-                    st.markdown(f'<div class="info-card"><h3>👋 Hello {resume_data["name"]}!</h3></div>', unsafe_allow_html=True)
+                    st.markdown(result_page['hello'], unsafe_allow_html=True)
                     
                     # Basic info section with styled cards
                     st.markdown('<h3 class="app-header">Your Basic Info</h3>', unsafe_allow_html=True)
                     
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.markdown(f'<div class="info-card"><strong>📧 Email:</strong> {resume_data["email"]}</div>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="info-card"><strong>📱 Mobile:</strong> {resume_data["mobile_number"]}</div>', unsafe_allow_html=True)
+                        st.markdown(result_page['email'], unsafe_allow_html=True)
+                        st.markdown(result_page['mobile'], unsafe_allow_html=True)
                     
                     with col2:
-                        st.markdown(f'<div class="info-card"><strong>📄 Pages:</strong> {resume_data["no_of_pages"]}</div>', unsafe_allow_html=True)
+                        st.markdown(result_page['pages'], unsafe_allow_html=True)
                     
                     # Skills section
                     st.markdown('<h3 class="app-header">🛠️ Detected Skills</h3>', unsafe_allow_html=True)
-                    if resume_data['skills']:
-                        skills_html = ''.join([f'<span class="skill-tag">{skill}</span>' for skill in resume_data['skills']])
-                        st.markdown(f'<div class="info-card">{skills_html}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown('<div class="info-card warning-card">No specific technical skills detected. Consider adding more technical skills to your resume.</div>', unsafe_allow_html=True)
-                    
-                    # Predict field and calculate score
-                    predicted_field = predict_field(resume_data['skills'])
-                    resume_score = calculate_resume_score(resume_data)
-                    candidate_level = determine_candidate_level(resume_score, len(resume_data['skills']))
+                    st.markdown(result_page['skills'], unsafe_allow_html=True)
                     
                     # Score and level
                     col1, col2 = st.columns(2)
@@ -463,27 +196,26 @@ def main():
                         st.metric("Candidate Level", candidate_level, delta=None)
                     
                     # Field prediction
-                    st.markdown(f'<div class="info-card success-card"><strong>🎯 Predicted Field:</strong> {predicted_field}</div>', unsafe_allow_html=True)
+                    st.markdown(result_page['field'], unsafe_allow_html=True)
                     
                     # Recommendations
-                    recommended_skills, recommended_courses = recommend_skills_and_courses(resume_data['skills'], predicted_field)
+                    recommended_skills, recommended_courses = recommend_skills_and_courses(resume_data['skills'], predicted_field, get_skill_taxonomy())
                     
                     if recommended_skills:
                         st.markdown('<h3 class="app-header">💡 Recommended Skills</h3>', unsafe_allow_html=True)
-                        skills_html = ''.join([f'<span class="skill-tag">{skill}</span>' for skill in recommended_skills])
-                        st.markdown(f'<div class="info-card">{skills_html}</div>', unsafe_allow_html=True)
+                        st.markdown(render.INFO_CARD.format(body=render.skill_tags(tuple(recommended_skills))), unsafe_allow_html=True)
                     
                     if recommended_courses:
                         st.markdown('<h3 class="app-header">📚 Recommended Courses</h3>', unsafe_allow_html=True)
                         for course_name, course_link in recommended_courses:
-                            st.markdown(f'<div class="info-card">📖 <a href="{course_link}" target="_blank">{course_name}</a></div>', unsafe_allow_html=True)
+                            st.markdown(render.course_card(course_name, course_link), unsafe_allow_html=True)
                     
                     # Save to database
-                    if connection:
+                    if storage:
                         try:
                             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                             insert_data(
-                                connection,
+                                storage,
                                 resume_data['name'],
                                 resume_data['email'],
                                 resume_score,
@@ -512,34 +244,29 @@ def main():
         
         if st.button("Login"):
             if admin_user == os.environ.get('ADMIN_USER', 'admin') and admin_pass == os.environ.get('ADMIN_PASS', 'admin'):
+                # Remember the login so paging and filter widgets can rerun the script
+                st.session_state['admin_authenticated'] = True
                 st.success("✅ Login successful!")
-                
-                if connection:
-                    # Display user data
-                    cursor = connection.cursor()
-                    cursor.execute("SELECT * FROM user_data ORDER BY ID DESC")
-                    data = cursor.fetchall()
-                    
-                    if data:
-                        # Convert to DataFrame for better display
-                        df = pd.DataFrame(data)
-                        st.dataframe(df)
-                        
-                        # Download option
-                        csv = df.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download Data as CSV",
-                            data=csv,
-                            file_name=f"resume_data_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.info("No data available yet.")
-                else:
-                    st.warning("Database not connected.")
             else:
+                st.session_state['admin_authenticated'] = False
                 st.error("❌ Invalid credentials!")
         
+        if st.session_state.get('admin_authenticated'):
+            admin_dashboard.metrics_panel()
+            admin_dashboard.profiling_panel(lambda pdf_data: analyze_upload(pdf_data, build_result_page))
+            if storage:
+                # Filters, paging and counts all run in the database
+                filters = admin_dashboard.filter_controls(storage)
+                totals = storage.summary(filters)
+                st.caption(f"{totals['total']} matching records")
+                admin_dashboard.paginated_table(storage, filters)
+                
+                # Download option: rows are streamed to a file, not built in memory
+                if totals['total']:
+                    admin_dashboard.export_controls(storage, filters)
+            else:
+                st.warning("Database not connected.")
+        
         st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == '__main__':
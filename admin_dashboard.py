@@ -0,0 +1,174 @@
+"""
+Streamlit widgets for the paginated admin dashboard, shared by both apps.
+
+All filtering, paging and aggregation is done by the storage backend
+(see storage.py); these helpers only hold the filter values and the
+pagination cursor in st.session_state.
+"""
+
+import time
+
+import streamlit as st
+
+import export
+import metrics
+import profiling
+from admin_queries import PAGE_SIZE
+
+_EXPORT_LABELS = {'CSV': 'csv', 'CSV (gzip)': 'csv.gz', 'Parquet': 'parquet'}
+
+
+def filter_controls(storage, key='admin'):
+    """Renders the filter widgets and returns the filters dict for the storage queries."""
+    fields = [value for value, _ in storage.group_counts('Predicted_Field')]
+    levels = [value for value, _ in storage.group_counts('User_level')]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        field = st.selectbox("Predicted Field", ["All"] + fields, key=f"{key}_field")
+    with col2:
+        level = st.selectbox("Experience Level", ["All"] + levels, key=f"{key}_level")
+    with col3:
+        skill = st.text_input("Has Skill", key=f"{key}_skill")
+    col1, col2 = st.columns(2)
+    with col1:
+        min_score, max_score = st.slider("Resume Score", 0, 100, (0, 100), key=f"{key}_score")
+    with col2:
+        dates = st.date_input("Date Range", value=(), key=f"{key}_dates")
+
+    filters = {
+        'field': None if field == "All" else field,
+        'level': None if level == "All" else level,
+        'skill': skill.strip() or None,
+        'min_score': min_score if min_score > 0 else None,
+        'max_score': max_score if max_score < 100 else None,
+        'start_date': dates[0] if len(dates) >= 1 else None,
+        'end_date': dates[1] if len(dates) >= 2 else (dates[0] if len(dates) == 1 else None),
+    }
+    return filters
+
+
+def paginated_table(storage, filters, key='admin', page_size=PAGE_SIZE):
+    """Shows one page of rows with Previous/Next controls; returns the rows shown."""
+    cursors_key = f"{key}_page_cursors"
+    filters_key = f"{key}_page_filters"
+
+    # Changing any filter starts again from the newest row
+    if st.session_state.get(filters_key) != filters:
+        st.session_state[filters_key] = dict(filters)
+        st.session_state[cursors_key] = []
+    cursors = st.session_state.setdefault(cursors_key, [])
+
+    # Fetch one extra row to know whether a next page exists
+    rows = storage.fetch_page(filters, after_id=cursors[-1] if cursors else None, page_size=page_size + 1)
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if rows:
+        st.dataframe(rows, use_container_width=True)
+    else:
+        st.info("No records match the current filters.")
+
+    def previous_page():
+        st.session_state[cursors_key].pop()
+
+    def next_page():
+        st.session_state[cursors_key].append(rows[-1]['ID'])
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Previous", on_click=previous_page, disabled=not cursors, key=f"{key}_prev")
+    with col2:
+        st.caption(f"Page {len(cursors) + 1}")
+    with col3:
+        st.button("Next ➡️", on_click=next_page, disabled=not has_next, key=f"{key}_next")
+    return rows
+
+
+def export_controls(storage, filters, key='admin'):
+    """Streams the filtered rows to a file in the static folder and links to it."""
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        label = st.selectbox("Export format", list(_EXPORT_LABELS), key=f"{key}_export_format")
+    with col2:
+        clicked = st.button("📥 Prepare Download", key=f"{key}_export")
+    if clicked:
+        try:
+            with st.spinner("Exporting..."):
+                name, count = export.export_to_static(storage, filters, _EXPORT_LABELS[label])
+        except RuntimeError as e:
+            st.error(str(e))
+            return
+        st.markdown(
+            f'<a href="app/static/exports/{name}" download="{name}">📥 Download {count} records ({label})</a>',
+            unsafe_allow_html=True
+        )
+
+
+def metrics_panel(key='admin'):
+    """Shows this process's per-stage timings and its latest slow analyses (see metrics.py)."""
+    with st.expander("⏱️ Performance", expanded=False):
+        summary = metrics.stage_summary()
+        if not summary:
+            st.info("No analyses timed in this process yet.")
+            return
+        st.dataframe([
+            {'Stage': stage, 'Calls': count, 'Mean ms': round(mean * 1000, 2),
+             'p50 ms': round(p50 * 1000, 2), 'p95 ms': round(p95 * 1000, 2)}
+            for stage, count, mean, p50, p95 in summary
+        ], use_container_width=True)
+        st.caption("p50/p95 are estimated from histogram buckets. pdf_page and parse_page are per page; "
+                   "pdf_range is per page range of a long PDF extracted in parallel.")
+
+        slow = metrics.slow_analyses()
+        st.markdown(f"**Slow analyses** (≥ {metrics.SLOW_SECONDS:g}s, latest {metrics.SLOW_KEEP})")
+        if not slow:
+            st.caption("None so far.")
+            return
+        stages = sorted({stage for trace in slow for stage in trace.stages})
+        st.dataframe([
+            dict(
+                {'Upload': trace.name, 'Started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(trace.started_at)),
+                 'Total ms': round(trace.total * 1000, 1)},
+                **{f"{stage} ms": round(trace.stages.get(stage, 0.0) * 1000, 1) for stage in stages}
+            )
+            for trace in slow
+        ], use_container_width=True)
+
+
+def profiling_panel(analyze, key='admin'):
+    """Profiles the app's analysis of an uploaded PDF and shows saved profiles (see profiling.py).
+
+    `analyze(pdf_data)` runs the app's analysis without saving it and returns None for a textless PDF.
+    """
+    with st.expander("🔬 Profiling", expanded=False):
+        if profiling.ENABLED:
+            st.caption("SRA_PROFILE is on: every background analysis in this process is profiled.")
+        pdf_file = st.file_uploader("Profile the analysis of a resume", type=["pdf"], key=f"{key}_profile_upload")
+        if pdf_file is not None and st.button("▶️ Run profiled analysis", key=f"{key}_profile_run"):
+            with st.spinner("Profiling..."):
+                try:
+                    result, profile_key = profiling.profile_pipeline(pdf_file.getvalue(), analyze)
+                except Exception as e:
+                    st.error(f"Profiled analysis failed: {e}")
+                    return
+            st.session_state[f"{key}_profile"] = profile_key
+            if result is None:
+                st.warning("No text could be extracted; the profile covers the extraction only.")
+
+        profiles = profiling.list_profiles()
+        if not profiles:
+            st.info("No profiles saved yet.")
+            return
+        keys = [profile_key for profile_key, _ in profiles]
+        labels = {profile_key: f"{profile_key[:12]}  ({time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))})"
+                  for profile_key, mtime in profiles}
+        selected = st.session_state.get(f"{key}_profile")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            profile_key = st.selectbox("Saved profiles", keys, index=keys.index(selected) if selected in keys else 0,
+                                       format_func=labels.get, key=f"{key}_profile_select")
+        with col2:
+            sort = st.selectbox("Sort by", ['cumulative', 'tottime'], key=f"{key}_profile_sort")
+        st.caption(f"{profiling.total_time(profile_key):.3f}s profiled · {profiling.profile_path(profile_key)}")
+        st.dataframe(profiling.top_functions(profile_key, sort=sort), use_container_width=True)
@@ -0,0 +1,111 @@
+"""
+Server-side queries for the admin dashboard.
+
+Rows are read one page at a time with keyset pagination on ID (newest first),
+filters are applied in the WHERE clause, and the dashboard's counts and
+averages are computed with GROUP BY / aggregate queries, so the admin page
+never pulls the whole user_data table into memory.
+
+The helpers work on both backends; `dialect` is 'sqlite' (App_SQLite.py) or
+'mysql' (App.py) and only changes the parameter placeholder.
+"""
+
+import datetime
+
+PAGE_SIZE = 50
+
+# Columns the dashboard may group by; anything else is rejected
+GROUPABLE_COLUMNS = ('Predicted_Field', 'User_level')
+
+_PLACEHOLDERS = {'sqlite': '?', 'mysql': '%s'}
+
+
+def _placeholder(dialect):
+    try:
+        return _PLACEHOLDERS[dialect]
+    except KeyError:
+        raise ValueError(f"Unsupported dialect: {dialect}")
+
+
+def build_where(filters, dialect='sqlite'):
+    """Turns a filters dict into a WHERE clause and its parameters.
+
+    Supported keys: field, level, skill, min_score, max_score, start_date, end_date
+    (dates are datetime.date objects and the end date is inclusive).
+    """
+    filters = filters or {}
+    ph = _placeholder(dialect)
+    clauses, params = [], []
+
+    if filters.get('field'):
+        clauses.append(f"Predicted_Field = {ph}")
+        params.append(filters['field'])
+    if filters.get('level'):
+        clauses.append(f"User_level = {ph}")
+        params.append(filters['level'])
+    if filters.get('skill'):
+        # Served by the candidate_skill(skill, candidate_id) index
+        clauses.append(f"ID IN (SELECT candidate_id FROM candidate_skill WHERE skill = {ph})")
+        params.append(filters['skill'].strip().lower())
+    if filters.get('min_score') is not None:
+        clauses.append(f"resume_score >= {ph}")
+        params.append(filters['min_score'])
+    if filters.get('max_score') is not None:
+        clauses.append(f"resume_score <= {ph}")
+        params.append(filters['max_score'])
+    # DATETIME in MySQL, 'YYYY-MM-DD HH:MM:SS' text in SQLite; both compare correctly
+    if filters.get('start_date'):
+        clauses.append(f"Timestamp >= {ph}")
+        params.append(filters['start_date'].strftime('%Y-%m-%d 00:00:00'))
+    if filters.get('end_date'):
+        clauses.append(f"Timestamp < {ph}")
+        params.append((filters['end_date'] + datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00'))
+
+    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+    return where, params
+
+
+def _fetch_dicts(connection, sql, params):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        columns = [col[0] for col in cursor.description] if cursor.description else []
+    finally:
+        cursor.close()
+    return [row if isinstance(row, dict) else dict(zip(columns, row)) for row in rows]
+
+
+def fetch_page(connection, filters=None, after_id=None, page_size=PAGE_SIZE, dialect='sqlite'):
+    """Returns up to `page_size` rows (as dicts) with ID below `after_id`, newest first."""
+    where, params = build_where(filters, dialect)
+    if after_id is not None:
+        where += (" AND " if where else " WHERE ") + f"ID < {_placeholder(dialect)}"
+        params.append(after_id)
+    sql = f"SELECT * FROM user_data{where} ORDER BY ID DESC LIMIT {int(page_size)}"
+    return _fetch_dicts(connection, sql, params)
+
+
+def export_query(filters=None, dialect='sqlite'):
+    """Returns (sql, params) selecting every filtered row, newest first, for exports."""
+    where, params = build_where(filters, dialect)
+    return f"SELECT * FROM user_data{where} ORDER BY ID DESC", params
+
+
+def group_counts(connection, column, filters=None, dialect='sqlite'):
+    """Returns [(value, count), ...] for `column`, most common first."""
+    if column not in GROUPABLE_COLUMNS:
+        raise ValueError(f"Cannot group by {column}")
+    where, params = build_where(filters, dialect)
+    sql = f"SELECT {column} AS value, COUNT(*) AS total FROM user_data{where} GROUP BY {column} ORDER BY total DESC"
+    return [(row['value'], row['total']) for row in _fetch_dicts(connection, sql, params)]
+
+
+def summary(connection, filters=None, dialect='sqlite'):
+    """Returns {'total': int, 'avg_score': float or None} for the filtered rows."""
+    where, params = build_where(filters, dialect)
+    sql = f"SELECT COUNT(*) AS total, AVG(resume_score) AS avg_score FROM user_data{where}"
+    rows = _fetch_dicts(connection, sql, params)
+    row = rows[0] if rows else {'total': 0, 'avg_score': None}
+    avg_score = float(row['avg_score']) if row['avg_score'] is not None else None
+    return {'total': int(row['total'] or 0), 'avg_score': avg_score}
@@ -0,0 +1,141 @@
+"""
+Content-addressed cache for resume analysis results.
+
+Streamlit reruns the whole script on every widget interaction, so without a
+cache the same uploaded PDF is re-read and re-parsed each time a user touches
+a control. Entries are keyed by the SHA-256 of the uploaded bytes and kept in a
+bounded in-memory LRU, backed by an on-disk JSON tier that survives restarts.
+
+Keys also carry the cache's namespace (each app stores differently shaped
+results) and ANALYSIS_VERSION, so entries written by other code are never
+served.
+
+Cached values are shared, not copied: get() returns a read-only view of the
+stored dict, so a rerun costs a lookup however large the analysis is.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.analysis_cache')
+# Bump whenever parsing, extraction or scoring changes the cached results
+ANALYSIS_VERSION = 4
+
+
+def content_hash(data):
+    """Returns the hex SHA-256 digest used as the cache key for uploaded bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class AnalysisCache:
+    """Two-tier (memory LRU + disk) cache of analysis results keyed by content hash."""
+
+    def __init__(self, max_entries=128, cache_dir=DEFAULT_CACHE_DIR, max_disk_entries=2048, namespace=''):
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns a read-only view of the cached value for `key`, or None on a miss.
+
+        The view shares the cached objects: use dict(value, ...) to add keys, and
+        do not modify nested values.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return MappingProxyType(self._entries[key])
+
+        value = self._read_disk(key)
+        if value is not None:
+            self._remember(key, value)
+            return MappingProxyType(value)
+        return None
+
+    def put(self, key, value):
+        """Stores `value` (a JSON-serializable dict) in both tiers."""
+        # Copied once on the way in, so later changes to the caller's dict never leak into the cache
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+        self._write_disk(key, value)
+
+    def key_for(self, data, version=''):
+        """Returns the cache key for `data` analyzed with logic/data `version`.
+
+        The key starts with the content hash, followed by the namespace and ANALYSIS_VERSION.
+        """
+        parts = [content_hash(data), self.namespace, f"v{ANALYSIS_VERSION}", str(version)]
+        return '.'.join(part for part in parts if part)
+
+    def clear(self):
+        """Drops every entry from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            # Touch the file so disk eviction is least-recently-used as well
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, value):
+        if not self.cache_dir:
+            return
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._disk_path(key))
+            self._prune_disk()
+        except (OSError, TypeError, ValueError):
+            # The disk tier is best-effort; the in-memory entry is still valid
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _prune_disk(self):
+        files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        excess = len(files) - self.max_disk_entries
+        if excess <= 0:
+            return
+        files.sort(key=lambda path: os.path.getmtime(path))
+        for path in files[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,184 @@
+"""
+Streamlit glue shared by App.py and App_SQLite.py.
+
+Both apps load the skill taxonomy, cache analyses, run them on a background
+job queue and poll for the result in the same way; only how a result is shown
+and saved differs. The process-wide resources here (taxonomy, analysis cache,
+job queue, metrics exporter, PDF extraction processes) are created once per
+server with st.cache_resource, as admin_dashboard.py does for the admin panel.
+"""
+
+import io
+import os
+import time
+
+import streamlit as st
+
+import jobs
+import metrics
+import profiling
+import render
+from analysis_cache import AnalysisCache, DEFAULT_CACHE_DIR
+from pdf_extract import EXTRACT_WORKERS, PageStream, start_workers
+from resume_analysis import parse_pages
+from taxonomy import Taxonomy, TAXONOMY_PATH, taxonomy_mtime
+
+POLL_INTERVAL = 0.5
+
+
+# --- SKILL TAXONOMY ---
+@st.cache_resource(max_entries=1)
+def load_skill_taxonomy(mtime):
+    """Parses skills_taxonomy.json once per file version, shared by every session."""
+    return Taxonomy.load(TAXONOMY_PATH)
+
+
+def get_skill_taxonomy():
+    """Returns the current taxonomy; editing the file triggers a reload on the next run."""
+    return load_skill_taxonomy(taxonomy_mtime(TAXONOMY_PATH))
+
+
+# --- ANALYSIS CACHE ---
+@st.cache_resource
+def get_analysis_cache(namespace):
+    """Returns the process-wide cache of analyses keyed by uploaded-file hash.
+
+    Each app passes its own `namespace`: their results differ in shape, so they never share entries.
+    """
+    return AnalysisCache(
+        max_entries=int(os.environ.get('ANALYSIS_CACHE_SIZE', 128)),
+        cache_dir=os.environ.get('ANALYSIS_CACHE_DIR', DEFAULT_CACHE_DIR),
+        namespace=namespace
+    )
+
+
+# --- PROCESS-WIDE SERVICES ---
+@st.cache_resource
+def start_metrics_exporter():
+    """Starts the Prometheus exporters configured by METRICS_PORT / METRICS_FILE, once per process."""
+    return metrics.start_exporter_from_env()
+
+
+@st.cache_resource
+def start_extract_workers():
+    """Spawns the PDF extraction processes once per server, before the first long upload needs them."""
+    return start_workers()
+
+
+@st.cache_resource
+def get_job_queue():
+    """Returns the analysis worker pool shared by every session."""
+    return jobs.JobQueue(
+        max_workers=int(os.environ.get('ANALYSIS_WORKERS', 2)),
+        timeout=float(os.environ.get('ANALYSIS_TIMEOUT', 60))
+    )
+
+
+# --- BACKGROUND ANALYSIS ---
+def analyze_pdf(pdf_bytes, taxonomy, parse=parse_pages):
+    """Extracts and parses the PDF page by page, reporting partial results as it goes.
+
+    `parse` is resume_analysis.parse_pages, or a partial of it with the app's parsing rules.
+
+    Runs on a job worker thread, so it reports problems by raising rather than with st.* calls.
+    Returns None when no page had any text.
+    """
+    # Long documents are split across EXTRACT_WORKERS processes
+    with PageStream(pdf_bytes, workers=EXTRACT_WORKERS) as stream:
+        resume_data = parse(
+            (page.text for page in stream), taxonomy,
+            on_progress=lambda partial, pages_done: jobs.report_progress(
+                dict(partial, pages_done=pages_done, total_pages=stream.count)
+            )
+        )
+        extraction = stream.extraction()
+    if not resume_data:
+        return None
+
+    resume_data['no_of_pages'] = extraction.page_count
+    # The text is stored once; the per-page extraction is not needed after parsing
+    return {'text': extraction.text, 'resume_data': resume_data}
+
+
+def result_page(key, analysis, taxonomy, build_page):
+    """The app's results page for `analysis`, built by `build_page(analysis, taxonomy)` once per key.
+
+    Pages are memoized by render.page(), so a result shown again costs a dict lookup.
+    """
+    return render.page(key, lambda: build_page(analysis, taxonomy))
+
+
+def run_analysis(cache, key, pdf_data, taxonomy, build_page, parse=parse_pages):
+    """Job body: analyzes the PDF, builds its results page and stores the analysis in the cache."""
+    # Slow analyses and their per-stage times (extraction, parsing, field prediction,
+    # rendering) show up in the admin dashboard; with SRA_PROFILE=1 the run is also
+    # profiled under the upload's content hash
+    pdf_hash = key.split('.', 1)[0]
+    with metrics.trace(pdf_hash[:12]), profiling.profiled(pdf_hash):
+        analysis = analyze_pdf(io.BytesIO(pdf_data), taxonomy, parse)
+        if analysis:
+            result_page(key, analysis, taxonomy, build_page)
+    if analysis:
+        cache.put(key, analysis)
+    return analysis
+
+
+def analyze_upload(pdf_data, build_page, parse=parse_pages):
+    """Runs the app's whole analysis of `pdf_data` on this thread, for the profiling panel.
+
+    Nothing is cached, memoized or saved, so every call does the full work.
+    Returns the analysis with its page under 'page', or None when the PDF has no text.
+    """
+    taxonomy = get_skill_taxonomy()
+    analysis = analyze_pdf(io.BytesIO(pdf_data), taxonomy, parse)
+    if analysis is None:
+        return None
+    return dict(analysis, page=build_page(analysis, taxonomy))
+
+
+def show_job_progress(job):
+    """Shows a running job's status and whatever it has found so far."""
+    progress = job.progress
+    if not progress:
+        st.info(f"⏳ Analyzing your resume... ({job.status}, {job.elapsed:.0f}s)")
+        return
+    st.progress(min(1.0, progress['pages_done'] / max(1, progress['total_pages'])),
+                text=f"⏳ Analyzed {progress['pages_done']} of {progress['total_pages']} pages...")
+    st.markdown(render.hello_card(progress['name']), unsafe_allow_html=True)
+    st.markdown(render.contact_card(progress['email'], progress['mobile_number']), unsafe_allow_html=True)
+    if progress['skills']:
+        st.markdown(render.INFO_CARD.format(body=render.skill_tags(tuple(progress['skills']))), unsafe_allow_html=True)
+
+
+def get_analysis(pdf_data, namespace, build_page, parse=parse_pages):
+    """Returns the analysis of the uploaded bytes, queueing it on the worker pool if needed.
+
+    Identical uploads share one job. While the job runs the script shows its
+    status and reruns, so the session is never blocked by a slow PDF. The
+    analysis comes back with its cache 'key' and, under 'page', what
+    `build_page(analysis, taxonomy)` returned for it. `parse` is as for analyze_pdf().
+    """
+    cache = get_analysis_cache(namespace)
+    taxonomy = get_skill_taxonomy()
+    key = cache.key_for(pdf_data, taxonomy.fingerprint)
+    analysis = cache.get(key)
+    if analysis is not None:
+        return dict(analysis, key=key, page=result_page(key, analysis, taxonomy, build_page))
+
+    job_queue = get_job_queue()
+    job = job_queue.submit(key, run_analysis, cache, key, pdf_data, taxonomy, build_page, parse)
+    # Most resumes finish within one poll interval and render in this run
+    if not job.wait(POLL_INTERVAL):
+        show_job_progress(job)
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
+    if job.status != jobs.DONE:
+        st.error(f"❌ Resume analysis failed: {job.error}")
+        st.button("🔁 Retry", on_click=job_queue.discard, args=(key,))
+        return None
+    if job.result is None:
+        # Scanned or image-only PDFs have no text layer to analyze
+        st.warning("⚠️ No text could be extracted from this PDF. Scanned or image-only resumes are not supported.")
+        return None
+    # The job already built the page, so this is a lookup
+    return dict(job.result, key=key, page=result_page(key, job.result, taxonomy, build_page))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Headless batch analysis of resume PDFs.
+
+Analyzes every PDF in a directory (searched recursively) or a tarball and
+saves the results to the SQLite database used by App_SQLite.py (or to the
+backend named by SRA_DB_BACKEND, see storage.py). PDFs are
+fanned out across a process pool sized to the machine's cores and results
+are written in batches, one transaction per batch.
+
+Usage:
+    python batch_analyze.py resumes/
+    python batch_analyze.py campus_drive.tar.gz --workers 8 --batch-size 500
+"""
+
+import argparse
+import concurrent.futures
+import io
+import logging
+import os
+import sys
+import tarfile
+import time
+
+import database
+from resume_analysis import analyze_resume
+from storage import get_storage
+
+logger = logging.getLogger('batch_analyze')
+
+
+def iter_pdf_sources(path):
+    """Yields (name, payload) pairs, where payload is a file path or the PDF bytes."""
+    if os.path.isdir(path):
+        for root, _dirs, files in os.walk(path):
+            for file_name in sorted(files):
+                if file_name.lower().endswith('.pdf'):
+                    file_path = os.path.join(root, file_name)
+                    yield file_path, file_path
+    elif tarfile.is_tarfile(path):
+        # Members are streamed so a large archive is never held in memory at once
+        with tarfile.open(path, 'r:*') as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith('.pdf'):
+                    yield member.name, archive.extractfile(member).read()
+    elif path.lower().endswith('.pdf'):
+        yield path, path
+    else:
+        raise ValueError(f"{path} is not a directory, tarball or PDF file")
+
+
+def analyze_source(name, payload, timestamp):
+    """Worker entry point: analyzes one PDF and returns (name, record, error)."""
+    try:
+        file = io.BytesIO(payload) if isinstance(payload, bytes) else payload
+        return name, analyze_resume(file, timestamp=timestamp), None
+    except Exception as e:
+        return name, None, f"{type(e).__name__}: {e}"
+
+
+def run_batch(path, db_path=database.DB_PATH, workers=None, batch_size=200, max_in_flight=None, storage=None):
+    """Analyzes all PDFs under `path` and saves them; returns a summary dict.
+
+    Results go to `storage` if given, otherwise to get_storage(db_path=db_path).
+    """
+    workers = workers or os.cpu_count() or 1
+    # Bound the number of pending futures so tarball bytes don't pile up in memory
+    max_in_flight = max_in_flight or workers * 4
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    owns_storage = storage is None
+    storage = storage or get_storage(db_path=db_path)
+    storage.setup()
+
+    summary = {'processed': 0, 'saved': 0, 'empty': 0, 'failed': 0}
+    pending_records = []
+    started = time.perf_counter()
+
+    def flush():
+        summary['saved'] += storage.save_many(pending_records)
+        pending_records.clear()
+
+    def collect(done):
+        for future in done:
+            name, record, error = future.result()
+            summary['processed'] += 1
+            if error:
+                summary['failed'] += 1
+                logger.warning("Failed to analyze %s: %s", name, error)
+            elif record is None:
+                summary['empty'] += 1
+                logger.info("No text extracted from %s", name)
+            else:
+                pending_records.append(record)
+                if len(pending_records) >= batch_size:
+                    flush()
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight = set()
+            for name, payload in iter_pdf_sources(path):
+                in_flight.add(executor.submit(analyze_source, name, payload, timestamp))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                    collect(done)
+            collect(concurrent.futures.as_completed(in_flight))
+        flush()
+    finally:
+        if owns_storage:
+            storage.close()
+
+    summary['elapsed_seconds'] = round(time.perf_counter() - started, 2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a directory or tarball of resume PDFs in bulk.")
+    parser.add_argument('path', help="directory, tarball (.tar/.tar.gz) or single PDF")
+    parser.add_argument('--db', default=database.DB_PATH, help="SQLite database file (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=200, help="records per database transaction")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every skipped or failed file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(levelname)s %(message)s")
+
+    try:
+        summary = run_batch(args.path, db_path=args.db, workers=args.workers, batch_size=args.batch_size)
+    except ValueError as e:
+        parser.error(str(e))
+
+    rate = summary['processed'] / summary['elapsed_seconds'] if summary['elapsed_seconds'] else 0.0
+    print(f"Processed {summary['processed']} PDFs in {summary['elapsed_seconds']}s ({rate:.1f}/s): "
+          f"{summary['saved']} saved, {summary['empty']} without text, {summary['failed']} failed")
+    return 0 if summary['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Vectorized scoring of many parsed resumes at once.
+
+The per-resume functions in resume_analysis (predict_field,
+calculate_resume_score, determine_candidate_level) loop over dicts in
+Python; for a backfill of many resumes, score_batch() does the same work as
+array operations. The resumes' skills become one sparse resume x skill matrix
+(COO row/column/count arrays) against the taxonomy, field scores are its
+product with field_classifier's skill x field TF-IDF weights, and scores and
+levels are computed column-wise. Results match the per-resume functions
+exactly.
+"""
+
+import functools
+
+import numpy as np
+
+from field_classifier import DEFAULT_FIELD, SCORE_DIGITS, get_field_classifier
+from taxonomy import get_taxonomy
+
+# calculate_resume_score's skill-count tiers: >= 3, 5, 7, 10 skills give 10, 20, 30, 40 points
+SKILL_TIERS = np.array([3, 5, 7, 10])
+SKILL_TIER_POINTS = np.array([0, 10, 20, 30, 40])
+
+
+@functools.lru_cache(maxsize=4)
+def field_weights(taxonomy):
+    """Returns (skill -> column index, IDF per column, skill x field weight matrix, field names).
+
+    The weights are the taxonomy's FieldClassifier as a dense matrix.
+    """
+    classifier = get_field_classifier(taxonomy)
+    skill_index = {skill: index for index, skill in enumerate(classifier.index)}
+    idf = np.array([classifier.idf[skill] for skill in classifier.index])
+    field_columns = {field: column for column, field in enumerate(classifier.fields)}
+    weights = np.zeros((len(skill_index), len(classifier.fields)))
+    for skill, postings in classifier.index.items():
+        for field, weight in postings:
+            weights[skill_index[skill], field_columns[field]] = weight
+    return skill_index, idf, weights, classifier.fields
+
+
+def skill_matrix(skill_lists, skill_index):
+    """Builds the resume x skill matrix as COO (rows, columns, counts) arrays of its non-zero entries.
+
+    Each entry of `skill_lists` is a list of skills (each counted once) or a
+    {skill: occurrences} mapping. Skills are matched case-insensitively;
+    skills outside every field are dropped.
+    """
+    rows, columns, counts = [], [], []
+    for row, skills in enumerate(skill_lists):
+        matched = {}
+        if hasattr(skills, 'items'):
+            for skill, count in skills.items():
+                column = skill_index.get(skill.lower())
+                if column is not None:
+                    matched[column] = matched.get(column, 0) + count
+        else:
+            for skill in skills:
+                column = skill_index.get(skill.lower())
+                if column is not None:
+                    matched[column] = 1
+        rows.extend([row] * len(matched))
+        columns.extend(matched)
+        counts.extend(matched.values())
+    return np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64), np.array(counts, dtype=np.float64)
+
+
+def field_scores(skill_lists, taxonomy=None):
+    """Returns (N x fields matrix of cosine scores, field names), as FieldClassifier.scores() per row."""
+    skill_index, idf, weights, fields = field_weights(taxonomy or get_taxonomy())
+    rows, columns, counts = skill_matrix(skill_lists, skill_index)
+    keep = counts > 0
+    rows, columns, counts = rows[keep], columns[keep], counts[keep]
+    values = (1 + np.log(counts)) * idf[columns]
+    # Sparse x dense product: each non-zero (row, skill) adds its value times that skill's
+    # field weights to the row, summed with one bincount over the flattened N x fields result
+    n_rows, n_fields = len(skill_lists), len(fields)
+    cells = (rows[:, None] * n_fields + np.arange(n_fields)).ravel()
+    products = (values[:, None] * weights[columns]).ravel()
+    scores = np.bincount(cells, weights=products, minlength=n_rows * n_fields).reshape(n_rows, n_fields)
+    norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=n_rows))
+    scores = np.divide(scores, norms[:, None], out=np.zeros_like(scores), where=norms[:, None] > 0)
+    return np.round(scores, SCORE_DIGITS), fields
+
+
+def predict_fields(skill_lists, taxonomy=None):
+    """predict_field() for every skill list: the best-scoring field, or "General" when none matches."""
+    scores, fields = field_scores(skill_lists, taxonomy)
+    if not fields:
+        return np.full(len(skill_lists), DEFAULT_FIELD, dtype=object)
+    # argmax picks the first of tied fields, like FieldClassifier.rank()
+    best = np.asarray(fields, dtype=object)[scores.argmax(axis=1)]
+    return np.where(scores.max(axis=1) > 0, best, DEFAULT_FIELD)
+
+
+def skill_counts_of(resumes):
+    """Number of skills of each parsed resume, as an int array."""
+    return np.fromiter((len(resume.get('skills', [])) for resume in resumes), dtype=np.int64, count=len(resumes))
+
+
+def resume_scores(resumes):
+    """calculate_resume_score() for every parsed resume, as an int array."""
+    has_name = np.fromiter((bool(resume.get('name')) for resume in resumes), dtype=bool, count=len(resumes))
+    has_email = np.fromiter((bool(resume.get('email')) for resume in resumes), dtype=bool, count=len(resumes))
+    has_mobile = np.fromiter((bool(resume.get('mobile_number')) for resume in resumes), dtype=bool, count=len(resumes))
+    skill_counts = skill_counts_of(resumes)
+    scores = 10 * (has_name.astype(np.int64) + has_email + has_mobile)
+    scores += SKILL_TIER_POINTS[np.searchsorted(SKILL_TIERS, skill_counts, side='right')]
+    scores += np.minimum(30, skill_counts * 2)
+    return np.minimum(100, scores)
+
+
+def candidate_levels(scores, skill_counts):
+    """determine_candidate_level() over arrays of scores and skill counts."""
+    scores, skill_counts = np.asarray(scores), np.asarray(skill_counts)
+    return np.where((scores >= 80) & (skill_counts >= 8), "Experienced",
+                    np.where((scores >= 60) & (skill_counts >= 5), "Intermediate", "Fresher")).astype(object)
+
+
+def score_batch(resumes, taxonomy=None):
+    """Scores parsed resumes (parse_resume() dicts) in one pass.
+
+    Returns a dict of arrays aligned with `resumes`: 'field', 'score' and 'level'.
+    """
+    resumes = list(resumes)
+    scores = resume_scores(resumes)
+    return {
+        # Weighted by skill occurrences like analyze_resume(), when the parser recorded them
+        'field': predict_fields([resume.get('skill_counts') or resume.get('skills', []) for resume in resumes], taxonomy),
+        'score': scores,
+        'level': candidate_levels(scores, skill_counts_of(resumes)),
+    }
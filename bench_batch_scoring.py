@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch_scoring.score_batch() against scoring resumes one at a time.
+
+Generates N reproducible parsed resumes (skills drawn from the taxonomy plus
+some that are not in it, with and without name, email and phone), scores them
+with predict_field/calculate_resume_score/determine_candidate_level in a loop
+and with score_batch(), checks that both agree on every resume and prints the
+timings.
+
+--taxonomy benchmarks against another taxonomy file, e.g. a much larger one.
+
+Usage:
+    python bench_batch_scoring.py --resumes 100000
+    python bench_batch_scoring.py --resumes 100000 --taxonomy big_taxonomy.json
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import resume_analysis
+from batch_scoring import score_batch
+from taxonomy import Taxonomy, get_taxonomy
+
+UNKNOWN_SKILLS = ('cobol', 'typing', 'leadership', 'ms office', 'tally', 'photoshop cs2')
+
+
+def synthetic_resumes(count, skills, seed=0):
+    """Returns `count` parse_resume()-shaped dicts."""
+    rng = random.Random(seed)
+    resumes = []
+    for number in range(count):
+        picked = rng.sample(skills, rng.randint(0, min(15, len(skills))))
+        picked += rng.sample(UNKNOWN_SKILLS, rng.randint(0, 2))
+        picked = [skill.title() if rng.random() < 0.3 else skill for skill in picked]
+        resumes.append({
+            'name': f"Candidate {number}" if rng.random() < 0.9 else None,
+            'email': f"candidate{number}@example.com" if rng.random() < 0.8 else None,
+            'mobile_number': '9876543210' if rng.random() < 0.7 else None,
+            'skills': picked,
+            'skill_counts': {skill: rng.choice((1, 1, 1, 2, 3, 5)) for skill in picked},
+        })
+    return resumes
+
+
+def score_one_by_one(resumes, taxonomy):
+    # The undecorated functions, so per-call timing overhead doesn't count against the loop
+    predict_field = resume_analysis.predict_field.__wrapped__
+    calculate_resume_score = resume_analysis.calculate_resume_score.__wrapped__
+    fields, scores, levels = [], [], []
+    for resume in resumes:
+        score = calculate_resume_score(resume)
+        fields.append(predict_field(resume['skill_counts'], taxonomy))
+        scores.append(score)
+        levels.append(resume_analysis.determine_candidate_level(score, len(resume['skills'])))
+    return fields, scores, levels
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark vectorized batch scoring against the per-resume loop.")
+    parser.add_argument('--resumes', type=int, default=100000, help="parsed resumes to score (default: %(default)s)")
+    parser.add_argument('--taxonomy', help="taxonomy JSON file (default: the app's skills_taxonomy.json)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    taxonomy = Taxonomy.load(args.taxonomy) if args.taxonomy else get_taxonomy()
+    resumes = synthetic_resumes(args.resumes, taxonomy.skills, args.seed)
+    # Warm-up: builds the taxonomy's field weights outside the timing
+    score_batch(resumes[:10], taxonomy)
+
+    started = time.perf_counter()
+    fields, scores, levels = score_one_by_one(resumes, taxonomy)
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = score_batch(resumes, taxonomy)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = sum(
+        1 for i in range(len(resumes))
+        if (fields[i], scores[i], levels[i]) != (batch['field'][i], batch['score'][i], batch['level'][i])
+    )
+    print(f"{len(resumes)} resumes: loop {loop_seconds:.3f}s, batch {batch_seconds:.3f}s "
+          f"({loop_seconds / batch_seconds:.1f}x), {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark contact extraction on pathological input.
+
+Times contact_extraction.extract_contacts against the sequential patterns
+App.py used before (the unanchored `(\\+?\\d[\\s-]?){8,15}` among them) on
+digit-heavy and punctuation-heavy text of growing size, and reports the time
+per 1,000 characters. A linear scan keeps that figure flat as the input grows;
+the old patterns are quadratic on several of these inputs and are only timed
+up to --legacy-max characters.
+
+Usage:
+    python bench_contact_extraction.py
+    python bench_contact_extraction.py --sizes 10000 100000 1000000 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from contact_extraction import extract_contacts
+
+LEGACY_EMAIL = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+LEGACY_PHONES = [re.compile(pattern) for pattern in (
+    r"\b9\d{8}\b",
+    r"\b\d{9}\b",
+    r"(\+?\d[\s-]?){8,15}",
+    r"\b[6-9]\d{9}\b",
+)]
+
+# Each generator returns text of about `size` characters with no real contact in it
+INPUTS = {
+    'digit run': lambda size: '7' * size,
+    'grade table': lambda size: ('9 8 7 6 5 4 3 2 1 0 ' * (size // 20 + 1))[:size],
+    'dashed digits': lambda size: ('1-2-3-4-5-6-7- ' * (size // 15 + 1))[:size],
+    'email-like': lambda size: ('a.' * (size // 2 + 1))[:size] + '@',
+    'at signs': lambda size: ('a@' * (size // 2 + 1))[:size],
+    'dotted domain': lambda size: 'x@' + ('a.' * (size // 2 + 1))[:size],
+}
+
+
+def legacy_extract(text):
+    LEGACY_EMAIL.search(text)
+    for pattern in LEGACY_PHONES:
+        if pattern.search(text):
+            break
+
+
+def best_time(fn, text, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark contact extraction on pathological input.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--legacy-max', type=int, default=20_000,
+                        help="largest input to time the old patterns on; they are quadratic, so keep this small")
+    args = parser.parse_args(argv)
+
+    print(f"{'input':<15} {'chars':>10} {'extract ms':>11} {'us/1k chars':>12} {'legacy ms':>10}")
+    for name, make in INPUTS.items():
+        for size in args.sizes:
+            text = make(size)
+            elapsed = best_time(extract_contacts, text, args.repeat)
+            legacy = f"{best_time(legacy_extract, text, 1) * 1000:10.1f}" if size <= args.legacy_max else '-'
+            print(f"{name:<15} {len(text):>10} {elapsed * 1000:11.1f} {elapsed * 1e6 / len(text) * 1000:12.1f} {legacy:>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analysis pipeline stage by stage.
+
+Generates synthetic resume PDFs (synthetic_pdf.py) of a chosen page count,
+size and skill density and times each stage on every one of them:
+pdf_reader, count_pdf_pages, parse_resume, predict_field,
+calculate_resume_score, recommend_skills_and_courses and insert_data into a
+throwaway SQLite database. Reports p50/p95/p99 per stage and documents and
+pages per second, and writes everything as JSON so runs on different commits
+can be compared. Needs no network and no MySQL server.
+
+Usage:
+    python bench_pipeline.py --docs 50 --pages 2 --output before.json
+    python bench_pipeline.py --docs 50 --pages 2 --output after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import resume_analysis
+from storage import SQLiteStorage
+from synthetic_pdf import synthetic_resume_pdf
+from taxonomy import get_taxonomy
+
+STAGES = (
+    'pdf_reader', 'count_pdf_pages', 'parse_resume', 'predict_field',
+    'calculate_resume_score', 'recommend_skills_and_courses', 'insert_data',
+)
+
+
+def percentile(sorted_values, q):
+    """Linearly interpolated percentile (0-100) of an already sorted list."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(seconds):
+    """Count, mean and p50/p95/p99/max of a list of durations, in milliseconds."""
+    values = sorted(value * 1000 for value in seconds)
+    return {
+        'count': len(values),
+        'mean_ms': sum(values) / len(values) if values else None,
+        'p50_ms': percentile(values, 50),
+        'p95_ms': percentile(values, 95),
+        'p99_ms': percentile(values, 99),
+        'max_ms': values[-1] if values else None,
+    }
+
+
+def run_pipeline(pdf_data, taxonomy, storage, timings):
+    """Runs every stage on one PDF, appending each stage's duration to `timings`."""
+    def timed(stage, fn, *args):
+        started = time.perf_counter()
+        result = fn(*args)
+        timings[stage].append(time.perf_counter() - started)
+        return result
+
+    text = timed('pdf_reader', resume_analysis.pdf_reader, io.BytesIO(pdf_data))
+    pages = timed('count_pdf_pages', resume_analysis.count_pdf_pages, io.BytesIO(pdf_data))
+    resume_data = timed('parse_resume', resume_analysis.parse_resume, text, taxonomy)
+    skills = resume_data['skills']
+    field = timed('predict_field', resume_analysis.predict_field, skills, taxonomy)
+    score = timed('calculate_resume_score', resume_analysis.calculate_resume_score, resume_data)
+    recommended_skills, courses = timed('recommend_skills_and_courses', resume_analysis.recommend_skills_and_courses,
+                                        skills, field, taxonomy)
+    record = {
+        'name': resume_data['name'], 'email': resume_data['email'], 'res_score': score,
+        'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'no_of_pages': pages,
+        'reco_field': field, 'cand_level': resume_analysis.determine_candidate_level(score, len(skills)),
+        'skills': skills, 'recommended_skills': recommended_skills, 'courses': courses,
+    }
+    timed('insert_data', storage.save, record)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmark(docs=20, pages=2, words_per_page=300, skill_density=0.05, repeat=3, seed=0):
+    """Runs the benchmark and returns the report dict."""
+    taxonomy = get_taxonomy()
+    pdfs = [synthetic_resume_pdf(seed + i, pages, words_per_page, skill_density, taxonomy.skills) for i in range(docs)]
+    timings = {stage: [] for stage in STAGES}
+    totals = []
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, 'bench.db'))
+        storage.setup()
+        try:
+            # Warm-up: loads the taxonomy, recommendation store and database writer outside the timings
+            run_pipeline(pdfs[0], taxonomy, storage, {stage: [] for stage in STAGES})
+            for _ in range(repeat):
+                for pdf_data in pdfs:
+                    started = time.perf_counter()
+                    run_pipeline(pdf_data, taxonomy, storage, timings)
+                    totals.append(time.perf_counter() - started)
+        finally:
+            storage.close()
+
+    elapsed = sum(totals)
+    return {
+        'commit': git_commit(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'params': {'docs': docs, 'pages': pages, 'words_per_page': words_per_page,
+                   'skill_density': skill_density, 'repeat': repeat, 'seed': seed},
+        'pdf_bytes_mean': sum(len(pdf) for pdf in pdfs) / len(pdfs),
+        'stages': {stage: summarize(values) for stage, values in timings.items()},
+        'total': summarize(totals),
+        'throughput': {
+            'docs_per_second': len(totals) / elapsed if elapsed else None,
+            'pages_per_second': len(totals) * pages / elapsed if elapsed else None,
+        },
+    }
+
+
+def print_report(report, baseline=None):
+    print(f"{'stage':<30} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}" + (f" {'p50 vs base':>12}" if baseline else ''))
+    rows = list(report['stages'].items()) + [('total', report['total'])]
+    for stage, stats in rows:
+        line = f"{stage:<30} {stats['p50_ms']:9.2f} {stats['p95_ms']:9.2f} {stats['p99_ms']:9.2f}"
+        if baseline:
+            base = baseline['total'] if stage == 'total' else baseline['stages'].get(stage)
+            if base and base.get('p50_ms'):
+                line += f" {stats['p50_ms'] / base['p50_ms']:11.2f}x"
+        print(line)
+    throughput = report['throughput']
+    print(f"throughput: {throughput['docs_per_second']:.1f} docs/s, {throughput['pages_per_second']:.1f} pages/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume analysis pipeline on synthetic PDFs.")
+    parser.add_argument('--docs', type=int, default=20, help="distinct synthetic resumes (default: %(default)s)")
+    parser.add_argument('--pages', type=int, default=2, help="pages per resume (default: %(default)s)")
+    parser.add_argument('--words-per-page', type=int, default=300, help="words per page (default: %(default)s)")
+    parser.add_argument('--skill-density', type=float, default=0.05,
+                        help="fraction of words that are taxonomy skills (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3, help="passes over the resumes (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--compare', help="a previous JSON report to compare p50s against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.docs, args.pages, args.words_per_page, args.skill_density, args.repeat, args.seed)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print_report(report, baseline)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        if baseline:
+            print_report(report, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark the apps' cold start: a fresh Python process rendering the landing page.
+
+Each run starts a new interpreter, imports Streamlit's test harness, runs the
+app script once as a normal user would first see it (no upload, User mode)
+and reports how long that took, the process's peak RSS and which of the heavy
+optional dependencies got imported on the way. Streamlit's own import time is
+reported separately since every page pays it. Writes JSON so runs on
+different commits can be compared.
+
+Usage:
+    python bench_startup.py --repeat 5 --output before.json
+    python bench_startup.py --repeat 5 --output after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+from bench_pipeline import git_commit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APPS = ('App.py', 'App_SQLite.py')
+HEAVY_MODULES = ('plotly', 'pandas', 'pyarrow', 'pdfplumber', 'pdfminer', 'pymysql', 'streamlit_tags', 'PIL')
+
+# Runs in the child process; prints one JSON line
+CHILD = r"""
+import json, resource, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+done = time.perf_counter()
+print(json.dumps({
+    'streamlit_import_s': imported - started,
+    'landing_s': done - imported,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'loaded': [name for name in sys.argv[2:] if name in sys.modules],
+    'exceptions': [str(e.value) for e in at.exception],
+}))
+"""
+
+
+def measure(app, env=None):
+    """One cold start of `app` in a fresh interpreter; returns the child's measurements."""
+    result = subprocess.run([sys.executable, '-c', CHILD, os.path.join(HERE, app), *HEAVY_MODULES],
+                            capture_output=True, text=True, cwd=HERE, env=env, timeout=300)
+    if result.returncode != 0:
+        raise RuntimeError(f"{app} failed to start:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs, field):
+    values = [run[field] for run in runs]
+    return {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+
+
+def run_benchmark(apps=APPS, repeat=5):
+    """Runs the benchmark and returns the report dict."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [HERE, os.environ.get('PYTHONPATH')])))
+    results = {}
+    for app in apps:
+        runs = [measure(app, env) for _ in range(repeat)]
+        results[app] = {
+            'landing_s': summarize(runs, 'landing_s'),
+            'streamlit_import_s': summarize(runs, 'streamlit_import_s'),
+            'max_rss_mb': summarize(runs, 'max_rss_mb'),
+            'loaded': runs[-1]['loaded'],
+            'exceptions': runs[-1]['exceptions'],
+        }
+    return {
+        'commit': git_commit(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'backend': os.environ.get('SRA_DB_BACKEND'),
+        'apps': results,
+    }
+
+
+def print_report(report, baseline=None):
+    print(f"{'app':<16} {'landing s':>10} {'RSS MB':>8}" + (f" {'vs base':>8}" if baseline else '') + "  heavy modules loaded")
+    for app, stats in report['apps'].items():
+        landing = stats['landing_s']['median']
+        line = f"{app:<16} {landing:10.3f} {stats['max_rss_mb']['median']:8.1f}"
+        if baseline:
+            base = baseline['apps'].get(app)
+            line += f" {landing / base['landing_s']['median']:7.2f}x" if base else f" {'-':>8}"
+        print(line + "  " + (', '.join(stats['loaded']) or '-'))
+        for error in stats['exceptions']:
+            print(f"  exception: {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the apps' cold start to the landing page.")
+    parser.add_argument('apps', nargs='*', default=list(APPS), help="app scripts (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=5, help="cold starts per app (default: %(default)s)")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--compare', help="a previous JSON report to compare landing times against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.apps, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print_report(report, baseline)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        if baseline:
+            print_report(report, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Email and phone extraction for resumes.
+
+All patterns are compiled once at import and the text is scanned once with a
+single combined pattern. Every quantifier that can repeat is either bounded or
+can only start at the beginning of a run of characters (enforced with a
+lookbehind), so each scan position does a bounded amount of work and the scan
+stays linear on adversarial input such as long digit runs, tables of grades or
+strings of 'a@a@a@'.
+
+Rather than the first match of the first pattern that hits, every candidate is
+returned with a confidence score between 0 and 1, and callers take the best.
+"""
+
+import re
+from collections import namedtuple
+
+Candidate = namedtuple('Candidate', 'kind value raw score start')
+
+# Phones below this confidence are reported but never picked as "the" number
+MIN_PHONE_CONFIDENCE = 0.4
+
+_EMAIL = (
+    r'(?<![A-Za-z0-9._%+-])'
+    r'(?P<email>[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,8}\.[A-Za-z]{2,24})'
+    r'(?![A-Za-z0-9-])'
+)
+# 7-15 digits: optional +country code, optional (area code), digits separated
+# by at most one space, dot or hyphen
+_PHONE = (
+    r'(?<![\w+])'
+    r'(?P<phone>(?:\+\d{1,3}[\s.-]?)?(?:\(\d{1,5}\)[\s.-]?)?\d(?:[\s.-]?\d){5,14})'
+    r'(?!\d)'
+)
+CONTACT_PATTERN = re.compile(f'{_EMAIL}|{_PHONE}')
+
+_PHONE_CONTEXT = re.compile(r'(?:phone|mobile|mob|tel|telephone|cell|contact|ph|whatsapp)\W{0,3}$', re.IGNORECASE)
+_EMAIL_CONTEXT = re.compile(r'(?:e-?mail|mail)\W{0,3}$', re.IGNORECASE)
+_GROUP_SPLIT = re.compile(r'[\s.()-]+')
+_CONTEXT_CHARS = 20
+
+
+def _phone_score(raw, digits, context):
+    score = 0.5
+    if 10 <= len(digits) <= 13:
+        score += 0.2
+    elif len(digits) < 9:
+        score -= 0.2
+    if raw.startswith('+'):
+        score += 0.15
+    groups = [group for group in _GROUP_SPLIT.split(raw.lstrip('+')) if group]
+    # "9 8 7 6 5 4 3" is a row of grades, not a phone number
+    if sum(1 for group in groups if len(group) == 1) > 1:
+        score -= 0.5
+    if len(set(digits)) <= 2:
+        score -= 0.3
+    if _PHONE_CONTEXT.search(context):
+        score += 0.25
+    return max(0.0, min(1.0, score))
+
+
+def _email_score(raw, context):
+    score = 0.9
+    domain = raw.rsplit('@', 1)[1]
+    if domain.count('.') > 3:
+        score -= 0.2
+    if _EMAIL_CONTEXT.search(context):
+        score += 0.1
+    return max(0.0, min(1.0, score))
+
+
+def extract_contacts(text):
+    """Returns (emails, phones): lists of Candidate sorted by score, best first.
+
+    Phone values are digits only, with the leading '+' kept when present.
+    """
+    emails, phones = [], []
+    seen = set()
+    for match in CONTACT_PATTERN.finditer(text):
+        start = match.start()
+        context = text[max(0, start - _CONTEXT_CHARS):start]
+        raw = match.group('email')
+        if raw is not None:
+            if ('email', raw.lower()) not in seen:
+                seen.add(('email', raw.lower()))
+                emails.append(Candidate('email', raw, raw, _email_score(raw, context), start))
+            continue
+        raw = match.group('phone')
+        digits = re.sub(r'\D', '', raw)
+        value = ('+' if raw.startswith('+') else '') + digits
+        if ('phone', digits) not in seen:
+            seen.add(('phone', digits))
+            phones.append(Candidate('phone', value, raw, _phone_score(raw, digits, context), start))
+    # Highest score first; earlier in the document wins ties
+    emails.sort(key=lambda candidate: (-candidate.score, candidate.start))
+    phones.sort(key=lambda candidate: (-candidate.score, candidate.start))
+    return emails, phones
+
+
+def best_email(text):
+    """Returns the most likely email address in `text`, or None."""
+    emails, _ = extract_contacts(text)
+    return emails[0].value if emails else None
+
+
+def best_phone(text, min_confidence=MIN_PHONE_CONFIDENCE):
+    """Returns the most likely phone number in `text` (digits, optional '+'), or None."""
+    _, phones = extract_contacts(text)
+    return phones[0].value if phones and phones[0].score >= min_confidence else None
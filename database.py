@@ -0,0 +1,401 @@
+"""
+Persistence for analysis results.
+
+Shared by App_SQLite.py, App.py and the batch_analyze.py command-line tool, so
+none of these helpers touch Streamlit; callers decide how to report outcomes.
+
+Schema: resume_score and Page_no are integers, Timestamp is a datetime
+('YYYY-MM-DD HH:MM:SS' in SQLite), the list columns hold JSON arrays, and every
+detected skill is also stored lowercase in candidate_skill so that "all
+candidates with Kotlin" is an index lookup. Databases created with the old
+all-text schema are migrated in place by setup_database().
+"""
+
+import ast
+import json
+import os
+import sqlite3
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_analyzer.db')
+
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS user_data (
+        ID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Name TEXT NOT NULL,
+        Email_ID TEXT NOT NULL,
+        resume_score INTEGER NOT NULL,
+        Timestamp TIMESTAMP NOT NULL,
+        Page_no INTEGER NOT NULL,
+        Predicted_Field TEXT NOT NULL,
+        User_level TEXT NOT NULL,
+        Actual_skills TEXT NOT NULL,
+        Recommended_skills TEXT NOT NULL,
+        Recommended_courses TEXT NOT NULL,
+        UNIQUE(Name, Email_ID)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS candidate_skill (
+        candidate_id INTEGER NOT NULL REFERENCES user_data(ID) ON DELETE CASCADE,
+        skill TEXT NOT NULL,
+        PRIMARY KEY (candidate_id, skill)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_user_data_field ON user_data(Predicted_Field)",
+    "CREATE INDEX IF NOT EXISTS idx_user_data_level ON user_data(User_level)",
+    "CREATE INDEX IF NOT EXISTS idx_user_data_timestamp ON user_data(Timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_user_data_score ON user_data(resume_score)",
+    "CREATE INDEX IF NOT EXISTS idx_candidate_skill_skill ON candidate_skill(skill, candidate_id)",
+]
+
+MYSQL_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS user_data (
+        ID INT NOT NULL AUTO_INCREMENT,
+        Name VARCHAR(100) NOT NULL,
+        Email_ID VARCHAR(50) NOT NULL,
+        resume_score SMALLINT NOT NULL,
+        Timestamp DATETIME NOT NULL,
+        Page_no SMALLINT NOT NULL,
+        Predicted_Field VARCHAR(25) NOT NULL,
+        User_level VARCHAR(30) NOT NULL,
+        Actual_skills TEXT NOT NULL,
+        Recommended_skills TEXT NOT NULL,
+        Recommended_courses TEXT NOT NULL,
+        PRIMARY KEY (ID),
+        UNIQUE KEY unique_candidate (Name, Email_ID),
+        KEY idx_user_data_field (Predicted_Field),
+        KEY idx_user_data_level (User_level),
+        KEY idx_user_data_timestamp (Timestamp),
+        KEY idx_user_data_score (resume_score)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS candidate_skill (
+        candidate_id INT NOT NULL,
+        skill VARCHAR(100) NOT NULL,
+        PRIMARY KEY (candidate_id, skill),
+        KEY idx_candidate_skill_skill (skill, candidate_id),
+        FOREIGN KEY (candidate_id) REFERENCES user_data(ID) ON DELETE CASCADE
+    )
+    """,
+]
+
+_PLACEHOLDERS = {'sqlite': '?', 'mysql': '%s'}
+# user_data columns written by insert_data, in insert order
+RECORD_COLUMNS = ('Name', 'Email_ID', 'resume_score', 'Timestamp', 'Page_no', 'Predicted_Field',
+                  'User_level', 'Actual_skills', 'Recommended_skills', 'Recommended_courses')
+MIGRATION_CHUNK_SIZE = 1000
+
+
+def connect(db_path=DB_PATH):
+    """Opens a SQLite connection whose rows behave like dictionaries."""
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    # Needed for candidate_skill's ON DELETE CASCADE
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+def encode_list(values):
+    """Serializes a list column as JSON."""
+    return json.dumps(list(values or []))
+
+
+def decode_list(text):
+    """Parses a list column written as JSON, or as a Python repr by the old schema."""
+    if not text:
+        return []
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        value = ast.literal_eval(text)
+        return list(value) if isinstance(value, (list, tuple)) else []
+    except (ValueError, SyntaxError):
+        return []
+
+
+def _to_int(value):
+    """Converts old text values such as '85' or '85%' to int (0 if unparseable)."""
+    try:
+        return int(float(str(value).replace('%', '').strip()))
+    except ValueError:
+        return 0
+
+
+def save_skills(cursor, candidate_id, skills, dialect='sqlite'):
+    """Replaces the candidate_skill rows for one candidate."""
+    ph = _PLACEHOLDERS[dialect]
+    cursor.execute(f"DELETE FROM candidate_skill WHERE candidate_id = {ph}", (candidate_id,))
+    unique_skills = sorted({str(skill).strip().lower() for skill in skills if str(skill).strip()})
+    if unique_skills:
+        cursor.executemany(
+            f"INSERT INTO candidate_skill (candidate_id, skill) VALUES ({ph}, {ph})",
+            [(candidate_id, skill) for skill in unique_skills]
+        )
+
+
+# --- MIGRATION FROM THE ALL-TEXT SCHEMA ---
+def _sqlite_needs_migration(cursor):
+    cursor.execute("PRAGMA table_info(user_data)")
+    column_types = {row[1]: (row[2] or '').upper() for row in cursor.fetchall()}
+    return column_types.get('resume_score') == 'TEXT'
+
+
+def _migrate_sqlite(connection):
+    """Rebuilds a legacy user_data table with typed columns, keeping IDs."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("BEGIN")
+        cursor.execute("ALTER TABLE user_data RENAME TO user_data_legacy")
+        for statement in SQLITE_SCHEMA:
+            cursor.execute(statement)
+
+        read_cursor = connection.cursor()
+        read_cursor.execute("SELECT * FROM user_data_legacy ORDER BY ID")
+        while True:
+            rows = read_cursor.fetchmany(MIGRATION_CHUNK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                row = dict(row)
+                skills = decode_list(row['Actual_skills'])
+                cursor.execute("""
+                    INSERT INTO user_data (ID, Name, Email_ID, resume_score, Timestamp, Page_no, Predicted_Field, User_level, Actual_skills, Recommended_skills, Recommended_courses)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (row['ID'], row['Name'], row['Email_ID'], _to_int(row['resume_score']), row['Timestamp'],
+                      _to_int(row['Page_no']), row['Predicted_Field'], row['User_level'], encode_list(skills),
+                      encode_list(decode_list(row['Recommended_skills'])), encode_list(decode_list(row['Recommended_courses']))))
+                save_skills(cursor, row['ID'], skills)
+        read_cursor.close()
+
+        cursor.execute("DROP TABLE user_data_legacy")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _mysql_needs_migration(cursor):
+    cursor.execute("""
+        SELECT DATA_TYPE AS data_type FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'user_data' AND COLUMN_NAME = 'resume_score'
+    """)
+    row = cursor.fetchone()
+    data_type = (row['data_type'] if isinstance(row, dict) else row[0]) if row else None
+    return data_type is not None and data_type.lower() in ('varchar', 'char', 'text')
+
+
+def _migrate_mysql(connection):
+    """Converts a legacy user_data table's columns and indexes in place.
+
+    MySQL commits DDL implicitly, so this step cannot share a transaction with
+    the skill backfill; each step checks its own state instead.
+    """
+    with connection.cursor() as cursor:
+        # Normalize values so the column type changes below cannot fail
+        cursor.execute("UPDATE user_data SET resume_score = REPLACE(resume_score, '%', '')")
+        cursor.execute("UPDATE user_data SET resume_score = '0' WHERE resume_score NOT REGEXP '^[0-9]+(\\\\.[0-9]+)?$'")
+        cursor.execute("UPDATE user_data SET Page_no = '0' WHERE Page_no NOT REGEXP '^[0-9]+$'")
+        cursor.execute("""
+            ALTER TABLE user_data
+                MODIFY resume_score SMALLINT NOT NULL,
+                MODIFY Timestamp DATETIME NOT NULL,
+                MODIFY Page_no SMALLINT NOT NULL,
+                MODIFY Actual_skills TEXT NOT NULL,
+                MODIFY Recommended_skills TEXT NOT NULL,
+                MODIFY Recommended_courses TEXT NOT NULL,
+                ADD KEY idx_user_data_field (Predicted_Field),
+                ADD KEY idx_user_data_level (User_level),
+                ADD KEY idx_user_data_timestamp (Timestamp),
+                ADD KEY idx_user_data_score (resume_score)
+        """)
+    connection.commit()
+
+
+def _needs_skill_backfill(cursor):
+    """True when user_data has rows but candidate_skill has none, e.g. after an interrupted migration."""
+    cursor.execute("""
+        SELECT EXISTS(SELECT 1 FROM user_data) AS has_users,
+               EXISTS(SELECT 1 FROM candidate_skill) AS has_skills
+    """)
+    row = cursor.fetchone()
+    has_users, has_skills = (row['has_users'], row['has_skills']) if isinstance(row, dict) else tuple(row)
+    return bool(has_users) and not has_skills
+
+
+def _backfill_skills(connection, dialect='sqlite'):
+    """Rewrites str(list) columns as JSON and fills candidate_skill, in one transaction.
+
+    Rows already in JSON are left as they are, so running it again is harmless.
+    """
+    ph = _PLACEHOLDERS[dialect]
+    columns = ('ID', 'Actual_skills', 'Recommended_skills', 'Recommended_courses')
+    cursor = connection.cursor()
+    try:
+        last_id = 0
+        while True:
+            # Keyset pages, so a large table is never read into memory at once
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM user_data WHERE ID > {ph} ORDER BY ID LIMIT {MIGRATION_CHUNK_SIZE}",
+                (last_id,)
+            )
+            rows = [dict(zip(columns, row)) if isinstance(row, tuple) else dict(row) for row in cursor.fetchall()]
+            if not rows:
+                break
+            for row in rows:
+                skills = decode_list(row['Actual_skills'])
+                encoded = (encode_list(skills), encode_list(decode_list(row['Recommended_skills'])),
+                           encode_list(decode_list(row['Recommended_courses'])))
+                if encoded != (row['Actual_skills'], row['Recommended_skills'], row['Recommended_courses']):
+                    cursor.execute(
+                        f"UPDATE user_data SET Actual_skills = {ph}, Recommended_skills = {ph}, Recommended_courses = {ph} WHERE ID = {ph}",
+                        encoded + (row['ID'],)
+                    )
+                save_skills(cursor, row['ID'], skills, dialect)
+            last_id = rows[-1]['ID']
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _create_schema(connection, dialect):
+    cursor = connection.cursor()
+    try:
+        for statement in (MYSQL_SCHEMA if dialect == 'mysql' else SQLITE_SCHEMA):
+            cursor.execute(statement)
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+def setup_database(connection, dialect='sqlite'):
+    """Creates the tables and indexes if needed, migrating an old all-text schema.
+
+    The migration runs as independent steps (column types, then the skill
+    backfill), each checking its own state, so a run that stopped part way
+    through is completed by the next one.
+    """
+    if not connection:
+        return
+    cursor = connection.cursor()
+    try:
+        needs_migration = (_mysql_needs_migration if dialect == 'mysql' else _sqlite_needs_migration)(cursor)
+    finally:
+        cursor.close()
+    if needs_migration:
+        (_migrate_mysql if dialect == 'mysql' else _migrate_sqlite)(connection)
+
+    _create_schema(connection, dialect)
+
+    cursor = connection.cursor()
+    try:
+        needs_backfill = _needs_skill_backfill(cursor)
+    finally:
+        cursor.close()
+    if needs_backfill:
+        _backfill_skills(connection, dialect)
+
+
+# --- WRITES ---
+def _upsert_sql(dialect):
+    """One INSERT that updates the existing row when (Name, Email_ID) already exists."""
+    ph = _PLACEHOLDERS[dialect]
+    columns = ", ".join(RECORD_COLUMNS)
+    values = ", ".join([ph] * len(RECORD_COLUMNS))
+    updated = RECORD_COLUMNS[2:]
+    if dialect == 'mysql':
+        # VALUES() rather than the 8.0.19+ row alias so MariaDB works too
+        assignments = ", ".join(f"{col} = VALUES({col})" for col in updated)
+        return f"INSERT INTO user_data ({columns}) VALUES ({values}) ON DUPLICATE KEY UPDATE {assignments}"
+    assignments = ", ".join(f"{col} = excluded.{col}" for col in updated)
+    return f"INSERT INTO user_data ({columns}) VALUES ({values}) ON CONFLICT(Name, Email_ID) DO UPDATE SET {assignments}"
+
+
+def _record_values(name, email, res_score, timestamp, no_of_pages, reco_field, cand_level, skills, recommended_skills, courses):
+    return (name, email, int(res_score), timestamp, int(no_of_pages), reco_field, cand_level,
+            encode_list(skills), encode_list(recommended_skills), encode_list(courses))
+
+
+def upsert_records(cursor, records, dialect='sqlite'):
+    """Upserts records and syncs their candidate_skill rows with executemany; does not commit.
+
+    Skill rows are keyed through a subselect on (Name, Email_ID), so no
+    generated IDs have to be read back. Returns the upsert's rowcount.
+    """
+    ph = _PLACEHOLDERS[dialect]
+    # A later record for the same candidate wins, as it would row by row
+    latest = {}
+    for record in records:
+        latest[(record['name'], record['email'])] = record
+    records = list(latest.values())
+
+    cursor.executemany(_upsert_sql(dialect), [_record_values(**record) for record in records])
+    rowcount = cursor.rowcount
+
+    candidate_id = f"(SELECT ID FROM user_data WHERE Name = {ph} AND Email_ID = {ph})"
+    cursor.executemany(
+        f"DELETE FROM candidate_skill WHERE candidate_id = {candidate_id}",
+        [(record['name'], record['email']) for record in records]
+    )
+    skill_rows = [
+        (skill, record['name'], record['email'])
+        for record in records
+        for skill in sorted({str(skill).strip().lower() for skill in record['skills'] if str(skill).strip()})
+    ]
+    if skill_rows:
+        cursor.executemany(
+            f"INSERT INTO candidate_skill (candidate_id, skill) SELECT ID, {ph} FROM user_data WHERE Name = {ph} AND Email_ID = {ph}",
+            skill_rows
+        )
+    return rowcount
+
+
+def insert_data(connection, name, email, res_score, timestamp, no_of_pages, reco_field, cand_level, skills, recommended_skills, courses, dialect='sqlite'):
+    """Inserts or updates candidate data with a single upsert statement.
+
+    Returns 'inserted' or 'updated' when the backend reports which happened
+    (MySQL), 'saved' otherwise, or None when there is no connection.
+    """
+    if not connection:
+        return None
+    record = dict(name=name, email=email, res_score=res_score, timestamp=timestamp, no_of_pages=no_of_pages,
+                  reco_field=reco_field, cand_level=cand_level, skills=skills,
+                  recommended_skills=recommended_skills, courses=courses)
+    cursor = connection.cursor()
+    try:
+        rowcount = upsert_records(cursor, [record], dialect)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    if dialect == 'mysql':
+        # ON DUPLICATE KEY UPDATE reports 1 for an insert, 2 (or 0 if unchanged) for an update
+        return 'inserted' if rowcount == 1 else 'updated'
+    return 'saved'
+
+
+def insert_many(connection, records, dialect='sqlite'):
+    """Upserts many records (dicts keyed like insert_data's arguments) in one transaction."""
+    if not connection or not records:
+        return 0
+    cursor = connection.cursor()
+    try:
+        upsert_records(cursor, records, dialect)
+        connection.commit()
+        return len(records)
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
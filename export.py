@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Streaming export of user_data.
+
+Rows are pulled from the database cursor in fixed-size chunks and written
+straight to a file as CSV, gzip-compressed CSV or Parquet, so memory use stays
+flat however large the table is and nothing is base64-encoded. The admin
+dashboards write exports into Streamlit's static folder and link to them;
+this module can also be run directly to export to a local file:
+
+    python export.py resume_data.csv.gz
+    python export.py resume_data.parquet --db resume_analyzer.db
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import os
+import secrets
+import sys
+import time
+
+import database
+
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'csv.gz': ('.csv.gz', 'application/gzip'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+}
+CHUNK_SIZE = 1000
+
+# Served by Streamlit at app/static/exports/ when server.enableStaticServing is on
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'exports')
+EXPORT_MAX_AGE_SECONDS = 3600
+
+
+def iter_row_chunks(connection, sql, params=(), chunk_size=CHUNK_SIZE, cursor_class=None):
+    """Yields (columns, rows) with at most `chunk_size` tuples per chunk.
+
+    For MySQL pass an unbuffered cursor class (pymysql.cursors.SSCursor);
+    the default pymysql cursor would buffer the whole result client-side.
+    """
+    cursor = connection.cursor(cursor_class) if cursor_class else connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        first = True
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            # Always yield the first chunk so an empty result still gets a header
+            if not rows and not first:
+                break
+            first = False
+            yield columns, [tuple(row.values()) if isinstance(row, dict) else tuple(row) for row in rows]
+            if not rows:
+                break
+    finally:
+        cursor.close()
+
+
+def _write_csv(chunks, stream):
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    count = 0
+    header_written = False
+    for columns, rows in chunks:
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        writer.writerows(rows)
+        count += len(rows)
+    text.flush()
+    # Leave the underlying stream open for the caller
+    text.detach()
+    return count
+
+
+def _write_parquet(chunks, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+    writer = None
+    count = 0
+    try:
+        for columns, rows in chunks:
+            table = pa.Table.from_pylist([dict(zip(columns, row)) for row in rows],
+                                         schema=writer.schema if writer else None)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            count += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_chunks(chunks, path, fmt='csv'):
+    """Writes (columns, rows) chunks to `path` in format `fmt`; returns the row count."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == 'parquet':
+        return _write_parquet(chunks, path)
+    if fmt == 'csv.gz':
+        with gzip.open(path, 'wb') as stream:
+            return _write_csv(chunks, stream)
+    with open(path, 'wb') as stream:
+        return _write_csv(chunks, stream)
+
+
+def export_rows(connection, sql, params, path, fmt='csv', chunk_size=CHUNK_SIZE, cursor_class=None):
+    """Streams the query result to `path` in format `fmt`; returns the row count."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    return write_chunks(iter_row_chunks(connection, sql, params, chunk_size, cursor_class), path, fmt)
+
+
+def cleanup_exports(export_dir=EXPORT_DIR, max_age=EXPORT_MAX_AGE_SECONDS):
+    """Deletes exports older than `max_age` seconds."""
+    if not os.path.isdir(export_dir):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(export_dir):
+        path = os.path.join(export_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def export_to_static(storage, filters=None, fmt='csv', export_dir=EXPORT_DIR):
+    """Exports the filtered rows of a storage.Storage into the static folder under an unguessable name.
+
+    Returns (file name, row count); the file is served at app/static/exports/<name>.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    os.makedirs(export_dir, exist_ok=True)
+    cleanup_exports(export_dir)
+    name = f"resume_data_{time.strftime('%Y%m%d_%H%M%S')}_{secrets.token_urlsafe(12)}{EXPORT_FORMATS[fmt][0]}"
+    path = os.path.join(export_dir, name)
+    try:
+        count = storage.export(path, fmt, filters)
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return name, count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export user_data from the SQLite database.")
+    parser.add_argument('output', help="output file; format is taken from the extension (.csv, .csv.gz, .parquet)")
+    parser.add_argument('--db', default=database.DB_PATH, help="SQLite database file (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.output.endswith('.csv.gz'):
+        fmt = 'csv.gz'
+    elif args.output.endswith('.parquet'):
+        fmt = 'parquet'
+    else:
+        fmt = 'csv'
+    connection = database.connect(args.db)
+    try:
+        count = export_rows(connection, "SELECT * FROM user_data ORDER BY ID DESC", (), args.output, fmt)
+    finally:
+        connection.close()
+    print(f"Exported {count} rows to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Weighted field prediction from a resume's skills.
+
+Each field in the taxonomy becomes a TF-IDF weight vector over its keywords:
+a keyword listed for fewer fields says more about the field, and a keyword
+listed twice for a field counts twice. Vectors are L2-normalized and kept as
+an inverted index (skill -> [(field, weight)]), so scoring a resume is a
+sparse dot product over the skills it actually has. Resume skills are weighted
+by how often they occur (1 + log count) and by IDF, which makes the scores
+cosine similarities in [0, 1]: comparable across resumes, ranked, and usable
+for multi-label output.
+
+get_field_classifier() builds the classifier once per taxonomy and process.
+"""
+
+import math
+import threading
+from collections import Counter
+
+from taxonomy import get_taxonomy
+
+DEFAULT_FIELD = "General"
+# Fields scoring at least this much are reported as labels, at most LABEL_MAX of them
+LABEL_MIN_SCORE = 0.25
+LABEL_MAX = 3
+# Scores are rounded so float summation order never decides a tie
+SCORE_DIGITS = 9
+
+
+class FieldClassifier:
+    """TF-IDF field vectors from the taxonomy's field keywords."""
+
+    def __init__(self, field_keywords):
+        self.fields = list(field_keywords)
+        document_frequency = Counter(skill for keywords in field_keywords.values() for skill in set(keywords))
+        n_fields = len(self.fields)
+        # Smoothed IDF: every keyword keeps a positive weight, even one listed for all fields
+        self.idf = {skill: math.log((1 + n_fields) / (1 + df)) + 1 for skill, df in document_frequency.items()}
+
+        self.index = {}
+        for field, keywords in field_keywords.items():
+            vector = {skill: count * self.idf[skill] for skill, count in Counter(keywords).items()}
+            norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+            for skill, weight in vector.items():
+                self.index.setdefault(skill, []).append((field, weight / norm))
+        self._order = {field: position for position, field in enumerate(self.fields)}
+
+    def scores(self, skills):
+        """Returns {field: cosine score} for the fields sharing a skill with `skills`.
+
+        `skills` is a list of skill names or a {skill: occurrences} mapping;
+        matching is case-insensitive.
+        """
+        counts = Counter()
+        if hasattr(skills, 'items'):
+            for skill, count in skills.items():
+                counts[skill.lower()] += count
+        else:
+            counts.update({skill.lower() for skill in skills})
+
+        totals = {}
+        norm = 0.0
+        for skill, count in counts.items():
+            postings = self.index.get(skill)
+            if not postings or count <= 0:
+                continue
+            weight = (1 + math.log(count)) * self.idf[skill]
+            norm += weight * weight
+            for field, field_weight in postings:
+                totals[field] = totals.get(field, 0.0) + weight * field_weight
+        if not totals:
+            return {}
+        norm = math.sqrt(norm)
+        return {field: round(total / norm, SCORE_DIGITS) for field, total in totals.items()}
+
+    def rank(self, skills):
+        """Returns [(field, score), ...], best first; ties keep the taxonomy's field order."""
+        return sorted(self.scores(skills).items(), key=lambda item: (-item[1], self._order[item[0]]))
+
+    def predict(self, skills, default=DEFAULT_FIELD):
+        """The best-scoring field, or `default` when no skill belongs to any field."""
+        ranked = self.rank(skills)
+        return ranked[0][0] if ranked else default
+
+    def labels(self, skills, min_score=LABEL_MIN_SCORE, max_labels=LABEL_MAX):
+        """Multi-label prediction: up to `max_labels` (field, score) pairs scoring at least `min_score`.
+
+        The best field is always included when any field matches.
+        """
+        ranked = self.rank(skills)
+        return ranked[:1] + [(field, score) for field, score in ranked[1:max_labels] if score >= min_score]
+
+
+_classifiers_lock = threading.Lock()
+_classifiers = {}
+
+
+def get_field_classifier(taxonomy=None):
+    """Returns the process-wide FieldClassifier for `taxonomy` (default: the current taxonomy file)."""
+    taxonomy = taxonomy or get_taxonomy()
+    classifier = _classifiers.get(taxonomy.fingerprint)
+    if classifier is None:
+        with _classifiers_lock:
+            classifier = _classifiers.get(taxonomy.fingerprint)
+            if classifier is None:
+                classifier = _classifiers[taxonomy.fingerprint] = FieldClassifier(taxonomy.field_keywords)
+    return classifier
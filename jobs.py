@@ -0,0 +1,148 @@
+"""
+Background analysis jobs, so an upload never blocks its session's script run.
+
+Jobs are keyed by the analysis cache key (content hash + taxonomy version):
+submitting a key that is already queued, running or finished returns the same
+job, so identical uploads from several sessions are analyzed once. A bounded
+thread pool runs the jobs and the apps poll a job's status on each rerun.
+
+A running job can publish partial results with report_progress(), which the
+apps show while they poll.
+
+A job still running after `timeout` seconds is reported as timed out. Python
+threads cannot be killed, so the worker keeps its slot until the call returns,
+but its result is ignored and the user is told straight away.
+"""
+
+import concurrent.futures
+import threading
+import time
+from collections import OrderedDict
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+TIMED_OUT = 'timeout'
+
+FINISHED_STATES = (DONE, FAILED, TIMED_OUT)
+
+# The job running on the current worker thread, for report_progress()
+_current = threading.local()
+
+
+def report_progress(progress):
+    """Publishes partial results for the job running on this thread; a no-op outside a job."""
+    job = getattr(_current, 'job', None)
+    if job is not None:
+        job.progress = progress
+
+
+class Job:
+    """Status and outcome of one analysis."""
+
+    def __init__(self, key):
+        self.key = key
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.progress = None
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self._finished = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def wait(self, timeout=None):
+        """Blocks until the job finishes or `timeout` passes; returns whether it finished."""
+        return self._finished.wait(timeout) or self.finished
+
+    @property
+    def elapsed(self):
+        """Seconds since the job was submitted (or its total run time once finished)."""
+        return (self.finished_at or time.monotonic()) - self.submitted_at
+
+
+class JobQueue:
+    """Runs jobs on at most `max_workers` threads and keeps the latest `keep` finished jobs."""
+
+    def __init__(self, max_workers=2, timeout=60.0, keep=256):
+        self.timeout = timeout
+        self.keep = keep
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args):
+        """Queues `fn(*args)` under `key` unless a job for `key` already exists; returns the Job."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                self._jobs.move_to_end(key)
+                self._check_timeout(job)
+                return job
+            job = Job(key)
+            self._jobs[key] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, key):
+        """Returns the Job for `key`, or None if there is none."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                self._check_timeout(job)
+            return job
+
+    def discard(self, key):
+        """Forgets a finished job so the next submit for `key` runs it again."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.finished:
+                del self._jobs[key]
+
+    def pending(self):
+        """Number of jobs queued or running."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job, fn, args):
+        with self._lock:
+            if job.finished:
+                return
+            job.status = RUNNING
+            job.started_at = time.monotonic()
+        _current.job = job
+        try:
+            result, error = fn(*args), None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        finally:
+            _current.job = None
+        with self._lock:
+            # A job that already timed out keeps that status
+            if job.finished:
+                return
+            job.result, job.error = result, error
+            job.status = FAILED if error else DONE
+            job.finished_at = time.monotonic()
+            job._finished.set()
+
+    def _check_timeout(self, job):
+        if job.status == RUNNING and self.timeout and time.monotonic() - job.started_at > self.timeout:
+            job.status = TIMED_OUT
+            job.error = f"Analysis took longer than {self.timeout:g}s"
+            job.finished_at = time.monotonic()
+            job._finished.set()
+
+    def _prune(self):
+        finished = [key for key, job in self._jobs.items() if job.finished]
+        for key in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[key]
@@ -0,0 +1,262 @@
+"""
+Per-stage timing of the analysis pipeline.
+
+`timed(stage)` (a context manager and a decorator) records how long each
+stage takes into a per-process histogram: PDF page extraction (per page, or
+per page range when a long PDF is extracted in parallel), page parsing,
+field prediction, scoring, recommendations, saving and rendering. An analysis
+wrapped in `trace(name)` also collects its own per-stage breakdown, and the
+latest analyses slower than SLOW_SECONDS are kept for the admin dashboard.
+
+The histograms are exported in the Prometheus text format, either written to a
+file (for node_exporter's textfile collector) or served over HTTP; see
+start_exporter_from_env().
+"""
+
+import bisect
+import functools
+import http.server
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAME = 'sra_stage_duration_seconds'
+# Upper bounds in seconds, as in Prometheus' default buckets plus finer ones for the fast stages
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SLOW_SECONDS = float(os.environ.get('METRICS_SLOW_SECONDS', 2.0))
+SLOW_KEEP = int(os.environ.get('METRICS_SLOW_KEEP', 20))
+
+
+class Histogram:
+    """Cumulative-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.sum += seconds
+            self.count += 1
+
+    def snapshot(self):
+        """Returns (cumulative bucket counts including +Inf, sum, count)."""
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative, running = [], 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return cumulative, total, count
+
+    def quantile(self, q):
+        """Estimates the q-quantile (0-1) by interpolating within buckets, like histogram_quantile()."""
+        cumulative, _, count = self.snapshot()
+        if not count:
+            return None
+        rank = q * count
+        for index, running in enumerate(cumulative):
+            if running >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                previous = cumulative[index - 1] if index else 0
+                in_bucket = running - previous
+                return lower + (self.buckets[index] - lower) * ((rank - previous) / in_bucket if in_bucket else 1)
+        return self.buckets[-1]
+
+
+class Trace:
+    """Per-stage durations of one analysis."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.stages = {}
+        self.total = None
+
+    def add(self, stage, seconds):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+_slow = deque(maxlen=SLOW_KEEP)
+_current = threading.local()
+
+
+def histogram(stage):
+    """Returns the process-wide Histogram for `stage`, creating it on first use."""
+    hist = _histograms.get(stage)
+    if hist is None:
+        with _histograms_lock:
+            hist = _histograms.setdefault(stage, Histogram())
+    return hist
+
+
+def observe(stage, seconds):
+    """Records `seconds` for `stage`, and adds it to the trace running on this thread."""
+    histogram(stage).observe(seconds)
+    current = getattr(_current, 'trace', None)
+    if current is not None:
+        current.add(stage, seconds)
+
+
+class timed:
+    """Times a block (`with timed('stage'):`) or every call of a function (`@timed('stage')`)."""
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        observe(self.stage, time.perf_counter() - self._started)
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(self.stage, time.perf_counter() - started)
+        return wrapper
+
+
+@contextmanager
+def trace(name):
+    """Collects the stages timed on this thread into a Trace; slow ones are kept for slow_analyses()."""
+    current = Trace(name)
+    previous = getattr(_current, 'trace', None)
+    _current.trace = current
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        _current.trace = previous
+        current.total = time.perf_counter() - started
+        histogram('analysis').observe(current.total)
+        if current.total >= SLOW_SECONDS:
+            _slow.append(current)
+
+
+def slow_analyses():
+    """The latest analyses that took at least SLOW_SECONDS, newest first."""
+    return list(reversed(_slow))
+
+
+def stage_summary():
+    """Returns [(stage, count, mean, p50, p95), ...] in seconds, for display."""
+    with _histograms_lock:
+        items = sorted(_histograms.items())
+    rows = []
+    for stage, hist in items:
+        _, total, count = hist.snapshot()
+        if count:
+            rows.append((stage, count, total / count, hist.quantile(0.5), hist.quantile(0.95)))
+    return rows
+
+
+def reset():
+    with _histograms_lock:
+        _histograms.clear()
+    _slow.clear()
+
+
+# --- PROMETHEUS EXPORT ---
+def prometheus_text():
+    """All histograms in the Prometheus text exposition format."""
+    lines = [
+        f"# HELP {METRIC_NAME} Time spent in each resume analysis stage.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    with _histograms_lock:
+        items = sorted(_histograms.items())
+    for stage, hist in items:
+        cumulative, total, count = hist.snapshot()
+        for le, running in zip([f"{bound:g}" for bound in hist.buckets] + ['+Inf'], cumulative):
+            lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="{le}"}} {running}')
+        lines.append(f'{METRIC_NAME}_sum{{stage="{stage}"}} {total:.6f}')
+        lines.append(f'{METRIC_NAME}_count{{stage="{stage}"}} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path):
+    """Writes prometheus_text() to `path` atomically, so a collector never reads a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(prometheus_text())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = prometheus_text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port, host='127.0.0.1'):
+    """Serves /metrics on `host`:`port` from a daemon thread; returns the server."""
+    server = http.server.ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
+
+
+def start_file_writer(path, interval=15.0):
+    """Rewrites `path` every `interval` seconds from a daemon thread; returns the thread."""
+    def loop():
+        while True:
+            try:
+                write_prometheus(path)
+            except OSError as e:
+                logger.warning("Could not write metrics to %s: %s", path, e)
+            time.sleep(interval)
+    thread = threading.Thread(target=loop, name='metrics-file', daemon=True)
+    thread.start()
+    return thread
+
+
+def start_exporter_from_env():
+    """Starts the exporters configured by METRICS_PORT (and METRICS_HOST) and METRICS_FILE.
+
+    Returns the started exporters; neither is started when the variables are unset.
+    """
+    started = []
+    if os.environ.get('METRICS_PORT'):
+        try:
+            started.append(start_http_server(int(os.environ['METRICS_PORT']), os.environ.get('METRICS_HOST', '127.0.0.1')))
+        except OSError as e:
+            # Another app process already serves this port
+            logger.warning("Metrics endpoint not started on port %s: %s", os.environ['METRICS_PORT'], e)
+    if os.environ.get('METRICS_FILE'):
+        started.append(start_file_writer(os.environ['METRICS_FILE'], float(os.environ.get('METRICS_FILE_INTERVAL', 15))))
+    return started
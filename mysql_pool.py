@@ -0,0 +1,142 @@
+"""
+A small, thread-safe pool of pymysql connections for App.py.
+
+pymysql connections must not be shared between threads, and Streamlit runs
+every session's script in its own thread. Each storage operation (a save, a
+page of admin rows, an export) therefore checks a connection out and returns
+it as soon as the operation ends; see storage.MySQLStorage. Checked-out
+connections are health-checked with ping(reconnect=True), broken ones are
+dropped and replaced, and the pool never holds more than `max_size`
+connections.
+"""
+
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the checkout timeout."""
+
+
+def connect_from_env(**overrides):
+    """Opens a pymysql connection configured from DB_HOST, DB_USER, DB_PASS and DB_NAME."""
+    import pymysql
+
+    settings = dict(
+        host=os.environ.get('DB_HOST', 'localhost'),
+        user=os.environ.get('DB_USER', 'root'),
+        password=os.environ.get('DB_PASS', ''),
+        db=os.environ.get('DB_NAME', 'sra'),
+        charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor,
+        connect_timeout=int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+    )
+    settings.update(overrides)
+    return pymysql.connect(**settings)
+
+
+class ConnectionPool:
+    """Bounded LIFO pool; the most recently returned (warmest) connection is reused first."""
+
+    def __init__(self, connect=connect_from_env, max_size=5, timeout=10.0):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._closed = False
+
+    @property
+    def size(self):
+        """Number of open connections, idle or checked out."""
+        return self._size
+
+    def _open(self):
+        with self._lock:
+            if self._size >= self.max_size:
+                return None
+            self._size += 1
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def _discard(self, connection):
+        with self._lock:
+            self._size -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        """Checks out a healthy connection, opening one if the pool has room.
+
+        Raises PoolTimeout when every connection stays busy for `timeout`
+        seconds, and the driver's error when the server cannot be reached.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._open()
+            if connection is not None:
+                return connection
+            try:
+                connection = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise PoolTimeout(f"No database connection free after {timeout}s")
+
+        try:
+            # Reconnects transparently if the server dropped an idle connection
+            connection.ping(reconnect=True)
+        except Exception as e:
+            logger.warning("Dropping broken database connection: %s", e)
+            self._discard(connection)
+            connection = self._open()
+            if connection is None:
+                raise PoolTimeout("No database connection available")
+        return connection
+
+    def release(self, connection):
+        """Returns a connection to the pool, discarding it if it is no longer usable."""
+        if connection is None:
+            return
+        try:
+            if self._closed or not connection.open:
+                raise ConnectionError("connection closed")
+            # Never hand an open transaction to the next user
+            connection.rollback()
+        except Exception:
+            self._discard(connection)
+            return
+        self._idle.put(connection)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """`with pool.connection() as connection:` checks out and always returns."""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        """Closes the idle connections; busy ones are closed when released."""
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
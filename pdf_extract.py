@@ -0,0 +1,256 @@
+"""
+Single-pass PDF extraction.
+
+Opens a document once with pdfplumber and collects everything the analyzers
+need from it: the full text, the page count, per-page text and basic layout
+metadata. Previously the apps opened the same upload two or three times
+(pdfplumber for text, then pdfplumber or a pdfminer page walk for the count).
+
+Long documents can be split into contiguous page ranges that are extracted in
+a shared pool of EXTRACT_WORKERS processes and reassembled in page order;
+start_workers() spawns the pool ahead of the first upload. `max_pages` caps how many
+pages are analyzed at all (PDF_MAX_PAGES, unlimited by default). PageStream
+yields pages as they are extracted for consumers that can start early.
+"""
+
+import concurrent.futures
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import metrics
+
+MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', 0)) or None
+EXTRACT_WORKERS = int(os.environ.get('PDF_EXTRACT_WORKERS', min(4, os.cpu_count() or 1)))
+# Below this many pages, shipping work to other processes costs more than it saves
+PARALLEL_MIN_PAGES = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', 8))
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+# Set when worker processes cannot start here (e.g. an unguarded __main__); extraction then stays sequential
+_parallel_disabled = False
+
+
+@dataclass
+class PageText:
+    """Text and layout metadata for one page."""
+    number: int
+    text: str
+    width: float
+    height: float
+    char_count: int
+
+
+@dataclass
+class PDFExtraction:
+    """Everything extracted from a PDF in one pass."""
+    pages: list = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
+    # Pages in the document, which is more than len(pages) when extraction was capped
+    total_pages: int = None
+
+    @property
+    def page_count(self):
+        return self.total_pages if self.total_pages is not None else len(self.pages)
+
+    @property
+    def text(self):
+        """Full document text, one newline after each page that produced text."""
+        return ''.join(page.text + '\n' for page in self.pages if page.text)
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(pages=[PageText(**page) for page in data.get('pages', [])], metadata=data.get('metadata', {}),
+                   total_pages=data.get('total_pages'))
+
+
+def _page_text(number, page):
+    text = PageText(
+        number=number,
+        text=page.extract_text() or '',
+        width=float(page.width),
+        height=float(page.height),
+        char_count=len(page.chars)
+    )
+    # Release the parsed layout objects as we go; long documents would
+    # otherwise keep every page's character list alive until close
+    page.flush_cache()
+    return text
+
+
+def _extract_range(source, start, stop):
+    """Worker entry point: extracts pages [start, stop) of `source` (a path or the PDF bytes)."""
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        return [_page_text(number + 1, pdf.pages[number]) for number in range(start, stop)]
+
+
+def _get_executor():
+    """Returns the pool of EXTRACT_WORKERS processes shared by every extraction, started on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn rather than fork: the apps call this from multithreaded servers
+            _executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=EXTRACT_WORKERS, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+
+def _warm_worker():
+    import pdfplumber  # noqa: F401
+
+    return os.getpid()
+
+
+def start_workers():
+    """Spawns the extraction pool's processes in the background; returns their futures.
+
+    A spawned worker takes about half a second to start and import pdfplumber,
+    which would otherwise be paid by the first long upload. Does nothing when
+    extraction is sequential (EXTRACT_WORKERS < 2).
+    """
+    if EXTRACT_WORKERS < 2 or _parallel_disabled:
+        return []
+    executor = _get_executor()
+    # One task per worker, submitted before any has started, spawns them all
+    return [executor.submit(_warm_worker) for _ in range(EXTRACT_WORKERS)]
+
+
+def _disable_parallel(error):
+    """Drops a broken pool and falls back to sequential extraction for this process."""
+    global _executor, _parallel_disabled
+    logger.warning("Parallel PDF extraction unavailable, extracting sequentially: %s", error)
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+        _parallel_disabled = True
+
+
+def _submit_ranges(source, count, workers):
+    """Submits contiguous ranges of pages [0, count) to the worker processes; returns their futures in page order."""
+    workers = min(workers, count)
+    bounds = [count * i // workers for i in range(workers + 1)]
+    executor = _get_executor()
+    return [executor.submit(_extract_range, source, start, stop) for start, stop in zip(bounds, bounds[1:])]
+
+
+class PageStream:
+    """A PDF opened for lazy, in-order page extraction.
+
+    `total_pages` and `metadata` are known as soon as the stream is opened;
+    iterating yields each page's PageText as soon as it is extracted, so a
+    consumer can act on page 1 before later pages are parsed. With `workers`
+    > 1, long documents are split into that many page ranges, extracted on the
+    shared pool of EXTRACT_WORKERS processes and yielded range by range. extraction() finishes the iteration and returns
+    everything.
+    """
+
+    def __init__(self, file, max_pages=MAX_PAGES, workers=1):
+        if hasattr(file, 'seek'):
+            file.seek(0)
+        import pdfplumber
+
+        self._file = file
+        self._pdf = pdfplumber.open(file)
+        try:
+            self.metadata = {key: str(value) for key, value in (self._pdf.metadata or {}).items()}
+            self.total_pages = len(self._pdf.pages)
+        except Exception:
+            self._pdf.close()
+            raise
+        self.count = min(self.total_pages, max_pages) if max_pages else self.total_pages
+        self.workers = workers
+        self.pages = []
+        self._iterator = None
+
+    @property
+    def parallel(self):
+        return self.workers > 1 and self.count >= PARALLEL_MIN_PAGES and not _parallel_disabled
+
+    def __iter__(self):
+        # One shared generator, so breaking out of a loop and iterating again resumes where it stopped
+        if self._iterator is None:
+            self._iterator = self._collect()
+        return self._iterator
+
+    def _collect(self):
+        for page in (self._iter_parallel() if self.parallel else self._iter_sequential(0)):
+            self.pages.append(page)
+            yield page
+
+    def _iter_sequential(self, start):
+        for number in range(start, self.count):
+            # Timed per page, without the time the consumer spends between pages
+            started = time.perf_counter()
+            page = _page_text(number + 1, self._pdf.pages[number])
+            metrics.observe('pdf_page', time.perf_counter() - started)
+            yield page
+
+    def _iter_parallel(self):
+        # Workers open their own copy of the document
+        if hasattr(self._file, 'read'):
+            self._file.seek(0)
+            source = self._file.read()
+        else:
+            source = self._file
+        futures = _submit_ranges(source, self.count, self.workers)
+        done = 0
+        try:
+            for future in futures:
+                # Timed per range as 'pdf_range': the wait covers all of the range's pages, so
+                # booking it to its first page would skew the per-page histogram
+                started = time.perf_counter()
+                pages = future.result()
+                metrics.observe('pdf_range', time.perf_counter() - started)
+                for page in pages:
+                    done += 1
+                    yield page
+        except concurrent.futures.process.BrokenProcessPool as e:
+            _disable_parallel(e)
+            yield from self._iter_sequential(done)
+        finally:
+            # Ranges not started yet when the consumer stops early are not extracted at all
+            for future in futures:
+                future.cancel()
+
+    def extraction(self):
+        """Extracts whatever has not been iterated yet and returns the PDFExtraction."""
+        for _ in self:
+            pass
+        return PDFExtraction(pages=list(self.pages), metadata=self.metadata, total_pages=self.total_pages)
+
+    def close(self):
+        if self._iterator is not None:
+            # Cancels the pending ranges of an iteration that stopped early
+            self._iterator.close()
+        self._pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def extract_pdf(file, max_pages=MAX_PAGES, workers=1):
+    """Parses `file` (a path or binary file object) once and returns a PDFExtraction.
+
+    Only the first `max_pages` pages are extracted when a cap is given. With
+    `workers` > 1, documents of PARALLEL_MIN_PAGES or more pages are extracted
+    in that many processes. Errors from pdfplumber propagate to the caller,
+    which decides how to report them.
+    """
+    with PageStream(file, max_pages=max_pages, workers=workers) as stream:
+        return stream.extraction()
@@ -0,0 +1,139 @@
+"""
+PDF preview for the upload page.
+
+The apps used to base64-encode the whole upload into a data: URI iframe on
+every rerun, a third larger than the file and sent over the websocket each
+time. Now only uploads up to PREVIEW_MAX_BYTES are shown inline; larger ones
+are shown as low-resolution PNG thumbnails of the first pages, rendered once
+and written to Streamlit's static folder under the upload's content hash, so
+every rerun (and every session uploading the same file) just links to them.
+
+Streamlit serves static files other than images as text/plain, so the PDF
+itself cannot be served from there; thumbnails can.
+
+Configured with PDF_PREVIEW_MODE ('auto', 'inline', 'thumbnails' or 'off'),
+PDF_PREVIEW_MAX_BYTES, PDF_PREVIEW_PAGES and PDF_PREVIEW_DPI.
+"""
+
+import base64
+import io
+import logging
+import os
+import tempfile
+import time
+
+import streamlit as st
+
+from analysis_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_MODES = ('auto', 'inline', 'thumbnails', 'off')
+PREVIEW_MODE = os.environ.get('PDF_PREVIEW_MODE', 'auto').lower()
+PREVIEW_MAX_BYTES = int(os.environ.get('PDF_PREVIEW_MAX_BYTES', 1024 * 1024))
+THUMBNAIL_PAGES = int(os.environ.get('PDF_PREVIEW_PAGES', 3))
+THUMBNAIL_DPI = int(os.environ.get('PDF_PREVIEW_DPI', 50))
+
+# Served by Streamlit at app/static/previews/ when server.enableStaticServing is on
+THUMBNAIL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'previews')
+THUMBNAIL_URL = 'app/static/previews'
+THUMBNAIL_MAX_AGE_SECONDS = 24 * 3600
+
+
+def preview_mode(size, mode=PREVIEW_MODE, max_bytes=PREVIEW_MAX_BYTES):
+    """Returns how an upload of `size` bytes is previewed: 'inline', 'thumbnails' or 'off'."""
+    if mode not in PREVIEW_MODES:
+        raise ValueError(f"Unknown preview mode {mode!r}; expected one of {', '.join(PREVIEW_MODES)}")
+    if mode == 'auto':
+        return 'inline' if size <= max_bytes else 'thumbnails'
+    return mode
+
+
+def inline_html(pdf_data, height=800):
+    """The data: URI iframe, for small uploads only."""
+    base64_pdf = base64.b64encode(pdf_data).decode('utf-8')
+    return f'<div class="resume-display"><iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="{height}" type="application/pdf"></iframe></div>'
+
+
+def cleanup_thumbnails(thumb_dir=THUMBNAIL_DIR, max_age=THUMBNAIL_MAX_AGE_SECONDS):
+    """Deletes thumbnails not shown for `max_age` seconds."""
+    if not os.path.isdir(thumb_dir):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(thumb_dir):
+        path = os.path.join(thumb_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def thumbnails(pdf_data, pages=THUMBNAIL_PAGES, dpi=THUMBNAIL_DPI, thumb_dir=THUMBNAIL_DIR):
+    """Returns the file names of PNG thumbnails of the first `pages` pages, rendering them on first use.
+
+    Names are '<content hash>-<dpi>-<page>.png', so an upload that was seen
+    before costs a few stat calls.
+    """
+    prefix = f"{content_hash(pdf_data)}-{dpi}-"
+    # Page 1 is written last, so when it exists every page is there
+    if os.path.exists(os.path.join(thumb_dir, f"{prefix}1.png")):
+        names = []
+        now = time.time()
+        for number in range(1, pages + 1):
+            path = os.path.join(thumb_dir, f"{prefix}{number}.png")
+            try:
+                # Keep recently shown thumbnails from being cleaned up
+                os.utime(path, (now, now))
+            except OSError:
+                break
+            names.append(f"{prefix}{number}.png")
+        return names
+
+    import pdfplumber
+
+    os.makedirs(thumb_dir, exist_ok=True)
+    cleanup_thumbnails(thumb_dir)
+    rendered = []
+    try:
+        with pdfplumber.open(io.BytesIO(pdf_data)) as pdf:
+            for number, page in enumerate(pdf.pages[:pages], start=1):
+                fd, tmp_path = tempfile.mkstemp(dir=thumb_dir, suffix='.tmp')
+                rendered.append((tmp_path, f"{prefix}{number}.png"))
+                with os.fdopen(fd, 'wb') as f:
+                    page.to_image(resolution=dpi).original.save(f, format='PNG', optimize=True)
+        # Renamed into place only once complete, so a concurrent session never links to a partial file
+        for tmp_path, name in reversed(rendered):
+            os.replace(tmp_path, os.path.join(thumb_dir, name))
+    except Exception:
+        for tmp_path, _ in rendered:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+    return [name for _, name in rendered]
+
+
+def show_preview(pdf_data, height=800, mode=PREVIEW_MODE, max_bytes=PREVIEW_MAX_BYTES):
+    """Shows the upload inline if it is small, otherwise as cached page thumbnails."""
+    mode = preview_mode(len(pdf_data), mode, max_bytes)
+    if mode == 'off':
+        st.info("📄 Preview is turned off.")
+        return
+    if mode == 'inline':
+        st.markdown(inline_html(pdf_data, height), unsafe_allow_html=True)
+        return
+    try:
+        names = thumbnails(pdf_data)
+    except Exception as e:
+        logger.warning("Could not render preview thumbnails: %s", e)
+        st.info("📄 Preview is not available for this file.")
+        return
+    images = ''.join(
+        f'<img src="{THUMBNAIL_URL}/{name}" alt="Page {number}" style="width:100%; margin-bottom:10px; border:1px solid #ddd;">'
+        for number, name in enumerate(names, start=1)
+    )
+    st.markdown(f'<div class="resume-display">{images}</div>', unsafe_allow_html=True)
+    caption = f"Showing the first {len(names)} page(s)."
+    if len(pdf_data) > max_bytes:
+        caption += f" The file is {len(pdf_data) / 1024 / 1024:.1f} MB, too large to preview inline."
+    st.caption(caption)
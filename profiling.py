@@ -0,0 +1,123 @@
+"""
+Opt-in cProfile capture of single analyses.
+
+With SRA_PROFILE=1 every analysis the apps run in the background is profiled;
+independently, an admin can profile the calling app's own analysis of one
+chosen PDF, from text extraction through rendering (profile_pipeline). Nothing
+is cached or saved by a profiled run. Profiles are
+saved as pstats files named by the PDF's content hash under SRA_PROFILE_DIR,
+and top_functions() summarizes one for the admin dashboard, so a resume that
+is slow in production can be diagnosed from the profile it left behind.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+from contextlib import contextmanager
+
+from analysis_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get('SRA_PROFILE', '').lower() in ('1', 'true', 'yes', 'on')
+PROFILE_DIR = os.environ.get('SRA_PROFILE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.profiles')
+MAX_PROFILES = 200
+
+
+def profile_path(key, profile_dir=PROFILE_DIR):
+    return os.path.join(profile_dir, f"{key}.prof")
+
+
+def _save(profiler, key, profile_dir):
+    os.makedirs(profile_dir, exist_ok=True)
+    path = profile_path(key, profile_dir)
+    profiler.dump_stats(path)
+    _prune(profile_dir)
+    return path
+
+
+def _prune(profile_dir, keep=MAX_PROFILES):
+    paths = [os.path.join(profile_dir, name) for name in os.listdir(profile_dir) if name.endswith('.prof')]
+    paths.sort(key=os.path.getmtime)
+    for path in paths[:max(0, len(paths) - keep)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def profiled(key, enabled=None, profile_dir=PROFILE_DIR):
+    """Profiles the block into `<key>.prof` when profiling is on (SRA_PROFILE unless `enabled` is given).
+
+    Yields the cProfile.Profile, or None when not profiling.
+    """
+    if not (ENABLED if enabled is None else enabled):
+        yield None
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Only one profiler can be active at a time on Python 3.12+
+        logger.warning("Not profiling %s: %s", key, e)
+        yield None
+        return
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        try:
+            _save(profiler, key, profile_dir)
+        except OSError as e:
+            logger.warning("Could not save profile for %s: %s", key, e)
+
+
+def profile_pipeline(pdf_data, analyze, profile_dir=PROFILE_DIR):
+    """Runs `analyze(pdf_data)` (the calling app's analysis) once under the profiler.
+
+    `analyze` must not persist anything. Returns (its result, content hash used as the profile key).
+    """
+    key = content_hash(pdf_data)
+    with profiled(key, enabled=True, profile_dir=profile_dir):
+        result = analyze(pdf_data)
+    return result, key
+
+
+def list_profiles(profile_dir=PROFILE_DIR):
+    """Returns [(key, mtime), ...] of the saved profiles, newest first."""
+    if not os.path.isdir(profile_dir):
+        return []
+    profiles = []
+    for name in os.listdir(profile_dir):
+        if name.endswith('.prof'):
+            try:
+                profiles.append((name[:-len('.prof')], os.path.getmtime(os.path.join(profile_dir, name))))
+            except OSError:
+                pass
+    return sorted(profiles, key=lambda item: item[1], reverse=True)
+
+
+def top_functions(key, limit=25, sort='cumulative', profile_dir=PROFILE_DIR):
+    """Returns the saved profile's top `limit` functions by `sort` ('cumulative' or 'tottime').
+
+    Each row is a dict with the function, call counts and total/cumulative seconds.
+    """
+    stats = pstats.Stats(profile_path(key, profile_dir))
+    column = 3 if sort == 'cumulative' else 2
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][column], reverse=True)[:limit]
+    rows = []
+    for (file_name, line, function), (primitive_calls, calls, tottime, cumtime, _callers) in entries:
+        rows.append({
+            'function': function if file_name == '~' else f"{os.path.basename(file_name)}:{line}({function})",
+            'calls': str(calls) if calls == primitive_calls else f"{calls}/{primitive_calls}",
+            'tottime_s': round(tottime, 4),
+            'cumtime_s': round(cumtime, 4),
+        })
+    return rows
+
+
+def total_time(key, profile_dir=PROFILE_DIR):
+    """Total profiled seconds of a saved profile."""
+    return pstats.Stats(profile_path(key, profile_dir)).total_tt
@@ -0,0 +1,119 @@
+"""
+Process-wide store for skill and course recommendations.
+
+Recommendations come from courses.json when it holds a non-empty mapping and
+from the skill taxonomy otherwise. The parsed data and a lowercase skill index
+per field are built once and shared by every session; the file is re-checked
+at most every `check_interval` seconds and re-read only when its mtime changes,
+so a recommendation lookup normally does no file I/O at all. The store never
+writes courses.json.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+COURSES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'courses.json')
+
+
+class FieldRecommendations:
+    """Recommended skills and courses for one field, with a precomputed lowercase index."""
+
+    def __init__(self, skills, courses):
+        self.skills = list(skills)
+        self.courses = [list(course) for course in courses]
+        self.skill_keys = [skill.lower() for skill in self.skills]
+
+    def missing_skills(self, known_skills):
+        """Returns recommended skills not already in `known_skills` (case-insensitive)."""
+        known = {skill.lower() for skill in known_skills}
+        return [skill for skill, key in zip(self.skills, self.skill_keys) if key not in known]
+
+
+class RecommendationStore:
+    """Holds the current recommendation data and reloads it when its sources change."""
+
+    def __init__(self, path=COURSES_PATH, check_interval=5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._file_mtime = None
+        self._file_data = None
+        self._source = None
+        self._index = {}
+
+    def _file_changed(self):
+        """Re-stats courses.json if the check interval has elapsed; True if it changed."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval
+        try:
+            stat = os.stat(self.path)
+            mtime, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            mtime, size = None, 0
+        if mtime == self._file_mtime:
+            return False
+        self._file_mtime = mtime
+        # A missing or empty file simply means "use the taxonomy defaults"
+        self._file_data = self._read_file() if size else None
+        return True
+
+    def _read_file(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data:
+                return data
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load recommendation data from %s: %s. Using taxonomy defaults.", self.path, e)
+        return None
+
+    def index(self, taxonomy=None):
+        """Returns {field: FieldRecommendations} for the current data."""
+        taxonomy = taxonomy or get_taxonomy()
+        with self._lock:
+            changed = self._file_changed()
+            source = ('file', self._file_mtime) if self._file_data else ('taxonomy', taxonomy.fingerprint)
+            if changed or source != self._source:
+                data = self._file_data or taxonomy.recommendations
+                self._index = {
+                    field: FieldRecommendations(entry.get('skills', []), entry.get('courses', []))
+                    for field, entry in data.items()
+                }
+                self._source = source
+            return self._index
+
+    def data(self, taxonomy=None):
+        """Returns the recommendations as {field: {'skills': [...], 'courses': [...]}}."""
+        return {
+            field: {'skills': entry.skills, 'courses': entry.courses}
+            for field, entry in self.index(taxonomy).items()
+        }
+
+    def recommend(self, skills, field, taxonomy=None, max_skills=10, max_courses=5):
+        """Returns (missing recommended skills, courses) for `field`."""
+        entry = self.index(taxonomy).get(field)
+        if entry is None:
+            return [], []
+        return entry.missing_skills(skills)[:max_skills], entry.courses[:max_courses]
+
+
+_store_lock = threading.Lock()
+_stores = {}
+
+
+def get_recommendation_store(path=COURSES_PATH):
+    """Returns the process-wide RecommendationStore for `path`."""
+    with _store_lock:
+        if path not in _stores:
+            _stores[path] = RecommendationStore(path)
+        return _stores[path]
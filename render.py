@@ -0,0 +1,223 @@
+"""
+Static assets and HTML fragments for the apps' pages.
+
+Streamlit reruns the whole script on every interaction, and the apps used to
+re-read new_style.css and script.js from disk and rebuild every HTML blob
+(skill tags, tips list, score card) each time. Here assets are read once per
+process, templates are module constants, and rendered fragments are memoized:
+small fragments by their arguments, and a whole results page by the analysis
+key (content hash + taxonomy fingerprint), so showing a result again costs a
+dict lookup however often the user interacts with the page.
+
+Text taken from a resume is HTML-escaped before it goes into a fragment.
+"""
+
+import functools
+import html
+import os
+import threading
+from collections import OrderedDict
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGE_CACHE_SIZE = 256
+
+# --- TEMPLATES ---
+SCRIPT_TEMPLATE = """
+<script type="text/javascript">
+// Wrap in a function to avoid global scope issues
+(function() {{
+    {js_code}
+
+    // Call the initialization function
+    document.addEventListener('DOMContentLoaded', function() {{
+        initializeApp();
+    }});
+
+    // Also try to run it immediately in case DOM is already loaded
+    try {{
+        initializeApp();
+    }} catch(e) {{
+        console.log('Will initialize on DOMContentLoaded');
+    }}
+}})();
+</script>
+"""
+
+HELLO_CARD = '<div class="info-card"><h3>👋 Hello {name}!</h3></div>'
+CONTACT_CARD = '<div class="info-card"><strong>📧 Email:</strong> {email} &nbsp; <strong>📱 Mobile:</strong> {mobile}</div>'
+INFO_CARD = '<div class="info-card">{body}</div>'
+LABELLED_CARD = '<div class="info-card{extra_class}"><strong>{label}:</strong> {value}</div>'
+SKILL_TAG = '<span class="skill-tag">{skill}</span>'
+COURSE_CARD = '<div class="info-card">📖 <a href="{link}" target="_blank">{name}</a></div>'
+
+BASIC_INFO_TABLE = """
+<div class="info-card">
+    <table style="width:100%">
+        <tr>
+            <td style="width:30%"><strong>📝 Name:</strong></td>
+            <td>{name}</td>
+        </tr>
+        <tr>
+            <td><strong>📧 Email:</strong></td>
+            <td>{email}</td>
+        </tr>
+        <tr>
+            <td><strong>📱 Contact:</strong></td>
+            <td>{mobile}</td>
+        </tr>
+        <tr>
+            <td><strong>📄 Pages:</strong></td>
+            <td>{pages}</td>
+        </tr>
+    </table>
+</div>
+"""
+
+LEVEL_CARD = """
+<div class="info-card" style="border-left: 4px solid {color};">
+    <h3>{icon} Experience Level: <span style="color:{color};">{level}</span></h3>
+    <p>Based on your resume's content and structure</p>
+</div>
+"""
+# Icon and colour for each experience level App.py shows
+LEVEL_STYLES = {
+    'Fresher': ('🌱', '#4CAF50'),
+    'Intermediate': ('⚡', '#FF9800'),
+    'Experienced': ('🏆', '#2196F3'),
+}
+
+SKILLS_CARD = '<div class="info-card"><p>Skills extracted from your resume:</p><div style="margin-top:10px;">{tags}</div></div>'
+
+TIPS_CARD = '<div class="info-card"><h4>Resume Improvement Tips:</h4><ul style="list-style-type: none; padding-left: 0;">{items}</ul></div>'
+TIP_PRESENT = '<li style="margin-bottom: 10px; padding: 8px; background-color: #e8f5e9; border-left: 4px solid #4CAF50; border-radius: 4px;">✅ <strong>{tip}:</strong> Great job including this section!</li>'
+TIP_MISSING = '<li style="margin-bottom: 10px; padding: 8px; background-color: #fff8e1; border-left: 4px solid #FFC107; border-radius: 4px;">⚠️ <strong>{tip}:</strong> {message}</li>'
+
+SCORE_CARD = """
+<div class="info-card">
+    <h2 style="text-align: center; margin-bottom: 20px;">
+        <span class="score-value">{score}</span><span style="color: #666;"> / 100</span>
+    </h2>
+    <div class="custom-progress">
+        <div class="progress-value" style="width: {score}%;"></div>
+    </div>
+    <p style="text-align: center; margin-top: 15px; color: #666;">
+        This score is based on the presence of key sections in your resume
+    </p>
+</div>
+"""
+
+SCORE_ANIMATION_JS = """
+let currentScore = 0;
+const targetScore = {score};
+const duration = 1500; // 1.5 seconds
+const interval = 20; // Update every 20ms
+const steps = duration / interval;
+const increment = targetScore / steps;
+
+const scoreElement = document.querySelector('.score-value');
+if (scoreElement) {{
+    const timer = setInterval(() => {{
+        currentScore += increment;
+        if (currentScore >= targetScore) {{
+            clearInterval(timer);
+            currentScore = targetScore;
+        }}
+        scoreElement.textContent = Math.round(currentScore);
+    }}, interval);
+}}
+"""
+
+
+# --- STATIC ASSETS ---
+@functools.lru_cache(maxsize=None)
+def asset(name):
+    """Returns the text of a file next to the apps, read once per process."""
+    with open(os.path.join(ASSET_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def style_html(name='new_style.css'):
+    """The stylesheet wrapped in a <style> tag."""
+    return f'<style>{asset(name)}</style>'
+
+
+@functools.lru_cache(maxsize=64)
+def script_html(js_code):
+    """`js_code` wrapped to run initializeApp(); identical code yields the identical string,
+    so Streamlit keeps the existing component iframe instead of reloading it."""
+    return SCRIPT_TEMPLATE.format(js_code=js_code)
+
+
+# --- FRAGMENTS ---
+@functools.lru_cache(maxsize=1024)
+def skill_tags(skills):
+    """Skill tag spans for a tuple of skills."""
+    return ''.join(SKILL_TAG.format(skill=html.escape(str(skill))) for skill in skills)
+
+
+def hello_card(name):
+    return HELLO_CARD.format(name=html.escape(str(name)))
+
+
+def contact_card(email, mobile):
+    return CONTACT_CARD.format(email=html.escape(str(email)), mobile=html.escape(str(mobile)))
+
+
+def labelled_card(label, value, extra_class=''):
+    return LABELLED_CARD.format(label=label, value=html.escape(str(value)),
+                                extra_class=f' {extra_class}' if extra_class else '')
+
+
+def basic_info_table(name, email, mobile, pages):
+    return BASIC_INFO_TABLE.format(name=html.escape(str(name)), email=html.escape(str(email)),
+                                   mobile=html.escape(str(mobile)), pages=html.escape(str(pages)))
+
+
+@functools.lru_cache(maxsize=None)
+def level_card(level):
+    icon, color = LEVEL_STYLES.get(level, ('', '#666'))
+    return LEVEL_CARD.format(icon=icon, color=color, level=level)
+
+
+@functools.lru_cache(maxsize=256)
+def tips_card(tips):
+    """The tips list for a tuple of (tip, message, present) triples."""
+    return TIPS_CARD.format(items=''.join(
+        TIP_PRESENT.format(tip=tip) if present else TIP_MISSING.format(tip=tip, message=message)
+        for tip, message, present in tips
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def score_card(score):
+    return SCORE_CARD.format(score=score)
+
+
+@functools.lru_cache(maxsize=1024)
+def course_card(name, link):
+    return COURSE_CARD.format(name=html.escape(str(name)), link=html.escape(str(link), quote=True))
+
+
+# --- RESULT PAGES ---
+_pages = OrderedDict()
+_pages_lock = threading.Lock()
+
+
+def page(key, build):
+    """Returns the fragments built for analysis `key`, calling `build()` only on a miss.
+
+    `build` returns anything (usually a dict of HTML fragments and the values
+    derived alongside them); the latest PAGE_CACHE_SIZE pages are kept.
+    """
+    with _pages_lock:
+        if key in _pages:
+            _pages.move_to_end(key)
+            return _pages[key]
+    built = build()
+    with _pages_lock:
+        _pages[key] = built
+        _pages.move_to_end(key)
+        while len(_pages) > PAGE_CACHE_SIZE:
+            _pages.popitem(last=False)
+    return built
@@ -0,0 +1,226 @@
+"""
+Streamlit-free resume analysis pipeline.
+
+Holds the extraction, parsing, field prediction and scoring helpers used by
+App_SQLite.py so they can also run outside a Streamlit session, e.g. from the
+batch_analyze.py command-line tool and its worker processes.
+"""
+
+import datetime
+import logging
+import re
+from collections import Counter
+
+import metrics
+from contact_extraction import MIN_PHONE_CONFIDENCE, extract_contacts
+from field_classifier import get_field_classifier
+from pdf_extract import PageStream, extract_pdf
+from recommendations import COURSES_PATH, get_recommendation_store
+from taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+def load_recommendation_data(file_path=COURSES_PATH, taxonomy=None):
+    """Returns course/skill recommendations from the shared, mtime-validated store."""
+    return get_recommendation_store(file_path).data(taxonomy)
+
+def pdf_reader(file):
+    """Extracts text from PDF using pdfplumber for better accuracy."""
+    try:
+        return extract_pdf(file).text
+    except Exception as e:
+        logger.error("Error reading PDF: %s", e)
+        return ""
+
+def count_pdf_pages(file):
+    """Counts the number of pages in a PDF file."""
+    try:
+        # Opening the document reads the page tree only; no page is extracted
+        with PageStream(file) as stream:
+            return stream.total_pages
+    except Exception as e:
+        logger.error("Error counting PDF pages: %s", e)
+        return 0
+
+# --- CONTACT AND SKILL EXTRACTION ---
+# A line with 2-4 words among the first few lines is taken to be the name
+NAME_SEARCH_LINES = 5
+NAME_EXCLUDE_PATTERN = re.compile(r'\d|@|http|:|www', re.IGNORECASE)
+
+class ContactExtractor:
+    """Finds the name, email and mobile number page by page, stopping once all three are found."""
+
+    # Reported for a field that was not found
+    MISSING = 'Not Found'
+
+    def __init__(self):
+        self.name = None
+        self.email = None
+        self.mobile_number = None
+        self._lines_seen = 0
+
+    @property
+    def done(self):
+        return bool(self.name and self.email and self.mobile_number)
+
+    def feed(self, text):
+        """Scans the next page of text unless every field has already been found."""
+        if self.done:
+            return
+        if self.name is None:
+            self._find_name(text)
+        if self.email is None or self.mobile_number is None:
+            # Emails and phones come from one scan; the best-scoring candidate on the first page that has one wins
+            emails, phones = extract_contacts(text)
+            if self.email is None and emails:
+                self.email = emails[0].value
+            if self.mobile_number is None and phones and phones[0].score >= MIN_PHONE_CONFIDENCE:
+                self.mobile_number = phones[0].value
+
+    def _find_name(self, text):
+        if self._lines_seen >= NAME_SEARCH_LINES:
+            return
+        for line in text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            self._lines_seen += 1
+            if 2 <= len(line.split()) <= 4 and not NAME_EXCLUDE_PATTERN.search(line):
+                self.name = line
+                return
+            if self._lines_seen >= NAME_SEARCH_LINES:
+                return
+
+    def fields(self):
+        return {
+            'name': self.name or self.MISSING,
+            'email': self.email or self.MISSING,
+            'mobile_number': self.mobile_number or self.MISSING,
+        }
+
+class FirstLineContactExtractor(ContactExtractor):
+    """App.py's rules: the first line longer than one character is the name, and missing fields are ''.
+
+    Empty placeholders keep App.py's upsert key distinct for resumes without an email.
+    """
+
+    MISSING = ''
+
+    def _find_name(self, text):
+        for line in text.splitlines():
+            if len(line.strip()) > 1:
+                self.name = line.strip()
+                return
+
+def parse_pages(pages, taxonomy=None, on_progress=None, contact_extractor=ContactExtractor, title_skills=True):
+    """Parses resume text page by page as the pages arrive.
+
+    `pages` is any iterable of page texts (e.g. from a pdf_extract.PageStream).
+    Contact fields stop being searched once found, by `contact_extractor`'s
+    rules; skills are matched on every page and title-cased unless
+    `title_skills` is false. After each page `on_progress(partial_resume_data,
+    pages_done)` is called if given. Returns None when no page had any text.
+    """
+    taxonomy = taxonomy or get_taxonomy()
+    contact = contact_extractor()
+    skill_counts = Counter()
+    has_text = False
+    previous_tail = ''
+    pages_done = 0
+    for text in pages:
+        pages_done += 1
+        if text.strip():
+            has_text = True
+        with metrics.timed('parse_page'):
+            contact.feed(text)
+            # Single pass over the page with the taxonomy's compiled matcher (aliases resolve to
+            # canonical skills); the previous page's last line is included so a skill split
+            # across the page break still matches, but only matches ending on this page count
+            page_start = len(previous_tail) + 1
+            skill_counts.update(match.skill.title() if title_skills else match.skill
+                                for match in taxonomy.matcher.finditer(previous_tail + '\n' + text)
+                                if match.end > page_start)
+        previous_tail = text.rsplit('\n', 1)[-1]
+        if on_progress is not None:
+            on_progress(dict(contact.fields(), skills=sorted(skill_counts)), pages_done)
+
+    if not has_text:
+        return None
+    return dict(contact.fields(), skills=sorted(skill_counts), skill_counts=dict(skill_counts))
+
+def parse_resume(text, taxonomy=None):
+    """Parses resume text and extracts relevant information with improved regex."""
+    return parse_pages([text], taxonomy)
+
+@metrics.timed('recommend')
+def recommend_skills_and_courses(skills, field, taxonomy=None):
+    """Recommends skills and courses based on detected field."""
+    # Filters out skills already present; limits recommendations
+    return get_recommendation_store().recommend(skills, field, taxonomy, max_skills=10, max_courses=5)
+
+@metrics.timed('predict_field')
+def predict_field(skills, taxonomy=None):
+    """Predicts the field based on skills (a list, or {skill: occurrences} to weight by frequency)."""
+    # TF-IDF field vectors built once from the skill taxonomy
+    return get_field_classifier(taxonomy).predict(skills)
+
+@metrics.timed('calculate_resume_score')
+def calculate_resume_score(resume_data):
+    """Calculates a resume score based on various factors."""
+    score = 0
+    
+    # Basic information (30 points)
+    if resume_data.get('name'): score += 10
+    if resume_data.get('email'): score += 10
+    if resume_data.get('mobile_number'): score += 10
+    
+    # Skills (40 points)
+    skill_count = len(resume_data.get('skills', []))
+    if skill_count >= 10: score += 40
+    elif skill_count >= 7: score += 30
+    elif skill_count >= 5: score += 20
+    elif skill_count >= 3: score += 10
+    
+    # Additional factors (30 points)
+    # This is a simplified scoring system
+    score += min(30, skill_count * 2)
+    
+    return min(100, score)  # Cap at 100
+
+def determine_candidate_level(score, skills_count):
+    """Determines candidate level based on score and skills."""
+    if score >= 80 and skills_count >= 8:
+        return "Experienced"
+    elif score >= 60 and skills_count >= 5:
+        return "Intermediate"
+    else:
+        return "Fresher"
+
+def analyze_resume(file, timestamp=None, taxonomy=None):
+    """Runs the full analysis on one PDF and returns a record ready for insert_data.
+
+    Returns None when no text could be extracted from the document.
+    """
+    taxonomy = taxonomy or get_taxonomy()
+    with PageStream(file) as stream:
+        resume_data = parse_pages((page.text for page in stream), taxonomy)
+        page_count = stream.total_pages
+    if not resume_data:
+        return None
+
+    skills = resume_data['skills']
+    predicted_field = predict_field(resume_data['skill_counts'], taxonomy)
+    resume_score = calculate_resume_score(resume_data)
+    recommended_skills, recommended_courses = recommend_skills_and_courses(skills, predicted_field, taxonomy)
+    return {
+        'name': resume_data['name'],
+        'email': resume_data['email'],
+        'res_score': resume_score,
+        'timestamp': timestamp or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'no_of_pages': page_count,
+        'reco_field': predicted_field,
+        'cand_level': determine_candidate_level(resume_score, len(skills)),
+        'skills': skills,
+        'recommended_skills': recommended_skills,
+        'courses': recommended_courses
+    }
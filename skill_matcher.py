@@ -0,0 +1,93 @@
+"""
+Single-pass skill matching.
+
+Builds one compiled regular expression from a keyword table, with the
+alternatives folded into a prefix trie (``java(?:script)?`` rather than
+``java|javascript``) so that at any text position at most one branch survives
+past its first character. Matches must start and end on word boundaries, so
+'ui' no longer matches inside "build" and 'java' no longer matches inside
+"javascript". At each position the longest keyword wins, and the text is
+scanned once no matter how many keywords the table holds.
+"""
+
+import re
+from collections import Counter, namedtuple
+
+SkillMatch = namedtuple('SkillMatch', ['skill', 'start', 'end'])
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(keyword):
+    # casefold() rather than lower(): re.IGNORECASE also matches Unicode case
+    # variants such as 'ſ' (long s) for 's', which lower() leaves unchanged
+    return _WHITESPACE.sub(' ', keyword.strip().casefold())
+
+
+def _trie_pattern(node):
+    """Renders a trie (nested dicts, '' marking a word end) as a regex fragment."""
+    branches = []
+    for char in sorted(key for key in node if key):
+        # A space in a keyword matches any run of whitespace, including line breaks
+        atom = r'\s+' if char == ' ' else re.escape(char)
+        branches.append(atom + _trie_pattern(node[char]))
+
+    if not branches:
+        return ''
+    ends_here = '' in node
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    body = '(?:' + '|'.join(branches) + ')'
+    return body + '?' if ends_here else body
+
+
+class SkillMatcher:
+    """Matches a fixed set of keywords against text in a single pass."""
+
+    def __init__(self, keywords, aliases=None):
+        # Map each normalized keyword (and alias) back to the skill it reports
+        self._canonical = {}
+        for keyword in keywords:
+            normalized = _normalize(keyword)
+            if normalized:
+                self._canonical.setdefault(normalized, keyword)
+        for alias, keyword in (aliases or {}).items():
+            normalized = _normalize(alias)
+            if normalized:
+                self._canonical.setdefault(normalized, keyword)
+
+        trie = {}
+        for normalized in self._canonical:
+            node = trie
+            for char in normalized:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        if self._canonical:
+            self._pattern = re.compile(r'(?<!\w)' + _trie_pattern(trie) + r'(?!\w)', re.IGNORECASE)
+        else:
+            self._pattern = None
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def finditer(self, text):
+        """Yields a SkillMatch for every keyword occurrence, in text order."""
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text):
+            skill = self._canonical.get(_normalize(match.group(0)))
+            if skill is not None:
+                yield SkillMatch(skill, match.start(), match.end())
+
+    def find(self, text):
+        """Returns every keyword occurrence in `text` with its character offsets."""
+        return list(self.finditer(text))
+
+    def skills(self, text):
+        """Returns the set of distinct keywords found in `text`."""
+        return {match.skill for match in self.finditer(text)}
+
+    def counts(self, text):
+        """Returns a Counter of how often each keyword occurs in `text`."""
+        return Counter(match.skill for match in self.finditer(text))
@@ -0,0 +1,188 @@
+"""
+SQLite access tuned for many concurrent Streamlit sessions.
+
+Connections run in WAL mode with synchronous=NORMAL and memory-mapped I/O, so
+readers never block the writer and commits do not fsync on every transaction.
+All writes go through one SQLiteWriter thread: callers queue a job and wait for
+its result, and the thread runs every job waiting in the queue inside a single
+transaction (group commit), so a burst of uploads costs one commit instead of
+one per upload and never hits "database is locked". Reads use a small pool of
+read-only connections of their own.
+"""
+
+import concurrent.futures
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import database
+
+logger = logging.getLogger(__name__)
+
+MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+BUSY_TIMEOUT_MS = 5000
+
+_STOP = object()
+
+
+def tune(connection, read_only=False):
+    """Applies the WAL / synchronous / mmap pragmas to a connection."""
+    # journal_mode is stored in the database file; the rest are per connection
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute(f"PRAGMA mmap_size = {int(MMAP_SIZE)}")
+    connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    if read_only:
+        connection.execute("PRAGMA query_only = ON")
+    return connection
+
+
+def open_connection(db_path=database.DB_PATH, read_only=False):
+    """Opens a tuned connection (see database.connect)."""
+    return tune(database.connect(db_path), read_only=read_only)
+
+
+class SQLiteWriter:
+    """Owns the only writing connection and commits queued jobs in groups.
+
+    A job is a callable taking a cursor; it must not commit. Jobs that arrive
+    while a transaction is running are committed together in the next one.
+    """
+
+    def __init__(self, db_path=database.DB_PATH, max_batch=256):
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        # Opened here so a bad path fails the caller instead of the thread
+        self._connection = open_connection(db_path)
+        self._thread = threading.Thread(target=self._loop, name='sqlite-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, job):
+        """Queues `job` and returns a concurrent.futures.Future for its result."""
+        future = concurrent.futures.Future()
+        self._queue.put((job, future))
+        return future
+
+    def run(self, job, timeout=None):
+        """Queues `job` and waits for its result (re-raising its exception)."""
+        return self.submit(job).result(timeout)
+
+    def close(self, timeout=None):
+        """Finishes the queued jobs and stops the thread."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _loop(self):
+        connection = self._connection
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                group = [item]
+                stop = False
+                # Everything already waiting joins this transaction
+                while len(group) < self.max_batch:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    group.append(item)
+                self._commit_group(connection, group)
+                if stop:
+                    break
+        finally:
+            connection.close()
+
+    def _commit_group(self, connection, group):
+        group = [(job, future) for job, future in group if future.set_running_or_notify_cancel()]
+        if not group:
+            return
+        cursor = connection.cursor()
+        try:
+            try:
+                results = [job(cursor) for job, _ in group]
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.warning("Group commit of %d jobs failed: %s", len(group), e)
+                if len(group) == 1:
+                    group[0][1].set_exception(e)
+                else:
+                    # One bad job must not fail the others: retry each on its own
+                    self._commit_each(connection, cursor, group)
+                return
+        finally:
+            cursor.close()
+        for (_, future), result in zip(group, results):
+            future.set_result(result)
+
+    def _commit_each(self, connection, cursor, group):
+        for job, future in group:
+            try:
+                result = job(cursor)
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+class ReaderPool:
+    """Bounded pool of read-only connections; reads never wait on the writer in WAL mode."""
+
+    def __init__(self, db_path=database.DB_PATH, max_size=4, timeout=10.0):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._size < self.max_size
+            if can_open:
+                self._size += 1
+        if can_open:
+            try:
+                return open_connection(self.db_path, read_only=True)
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(f"No reader connection free after {self.timeout}s")
+
+    @contextmanager
+    def connection(self):
+        """`with readers.connection() as connection:` checks out and always returns."""
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._size -= 1
+            connection.close()
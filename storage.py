@@ -0,0 +1,346 @@
+"""
+One storage interface for analysis results, shared by both apps and the CLIs.
+
+    SQLiteStorage  - resume_analyzer.db in WAL mode (App_SQLite.py's default)
+    MySQLStorage   - the `sra` MySQL database through a connection pool (App.py's default)
+    MemoryStorage  - plain Python dicts, for benchmarks and tests
+
+Every backend offers the same batched writes (save, save_many), keyset-paginated
+reads (fetch_page), aggregates (group_counts, summary) and streaming export, so
+changes to the data path are made here once. get_storage() picks the backend
+from SRA_DB_BACKEND unless one is passed explicitly.
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import admin_queries
+import database
+import export
+import sqlite_engine
+from admin_queries import PAGE_SIZE
+
+BACKENDS = ('sqlite', 'mysql', 'memory')
+
+
+class Storage:
+    """Interface implemented by every backend."""
+
+    name = None
+    label = None
+    # Exception types the backend raises when the database itself fails, for `except` clauses
+    errors = ()
+
+    def setup(self):
+        """Creates (or migrates) the schema; cheap to call on every run."""
+        raise NotImplementedError
+
+    def available(self):
+        """True when the backend can currently be reached."""
+        return True
+
+    def save(self, record):
+        """Upserts one record (a dict keyed like database.insert_data's arguments).
+
+        Returns 'inserted', 'updated' or 'saved' when the backend cannot tell.
+        """
+        raise NotImplementedError
+
+    def save_many(self, records):
+        """Upserts many records in one transaction; returns how many were written."""
+        raise NotImplementedError
+
+    def fetch_page(self, filters=None, after_id=None, page_size=PAGE_SIZE):
+        """Returns up to `page_size` rows with ID below `after_id`, newest first."""
+        raise NotImplementedError
+
+    def group_counts(self, column, filters=None):
+        """Returns [(value, count), ...] for `column`, most common first."""
+        raise NotImplementedError
+
+    def summary(self, filters=None):
+        """Returns {'total': int, 'avg_score': float or None} for the filtered rows."""
+        raise NotImplementedError
+
+    def export(self, path, fmt='csv', filters=None):
+        """Streams the filtered rows to `path`; returns the row count."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+# --- SQL BACKENDS ---
+class SQLStorage(Storage):
+    """Shared implementation on top of database.py and admin_queries.py."""
+
+    export_cursor_class = None
+
+    def __init__(self):
+        self._ready = False
+        self._setup_lock = threading.Lock()
+
+    def connection(self):
+        """Context manager yielding a DB-API connection."""
+        raise NotImplementedError
+
+    def _create_schema(self, connection):
+        database.setup_database(connection, dialect=self.name)
+
+    def setup(self):
+        if self._ready:
+            return
+        with self._setup_lock:
+            if not self._ready:
+                with self.connection() as connection:
+                    self._create_schema(connection)
+                self._ready = True
+
+    def save(self, record):
+        with self.connection() as connection:
+            return database.insert_data(connection, dialect=self.name, **record)
+
+    def save_many(self, records):
+        with self.connection() as connection:
+            return database.insert_many(connection, records, dialect=self.name)
+
+    def fetch_page(self, filters=None, after_id=None, page_size=PAGE_SIZE):
+        with self.connection() as connection:
+            return admin_queries.fetch_page(connection, filters, after_id, page_size, dialect=self.name)
+
+    def group_counts(self, column, filters=None):
+        with self.connection() as connection:
+            return admin_queries.group_counts(connection, column, filters, dialect=self.name)
+
+    def summary(self, filters=None):
+        with self.connection() as connection:
+            return admin_queries.summary(connection, filters, dialect=self.name)
+
+    def export(self, path, fmt='csv', filters=None):
+        sql, params = admin_queries.export_query(filters, dialect=self.name)
+        with self.connection() as connection:
+            return export.export_rows(connection, sql, params, path, fmt, cursor_class=self.export_cursor_class)
+
+
+class SQLiteStorage(SQLStorage):
+    """SQLite in WAL mode: writes are group-committed by one writer thread, reads use pooled connections."""
+
+    name = 'sqlite'
+    label = 'SQLite'
+    errors = (sqlite3.Error, OSError)
+
+    def __init__(self, db_path=database.DB_PATH, readers=4):
+        super().__init__()
+        self.db_path = db_path
+        self.readers = sqlite_engine.ReaderPool(db_path, max_size=readers)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    def connection(self):
+        return self.readers.connection()
+
+    def setup(self):
+        if self._ready:
+            return
+        with self._setup_lock:
+            if not self._ready:
+                connection = sqlite_engine.open_connection(self.db_path)
+                try:
+                    database.setup_database(connection)
+                finally:
+                    connection.close()
+                self._ready = True
+
+    @property
+    def writer(self):
+        """The SQLiteWriter thread, started on first use."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = sqlite_engine.SQLiteWriter(self.db_path)
+        return self._writer
+
+    def save(self, record):
+        self.writer.run(lambda cursor: database.upsert_records(cursor, [record]))
+        return 'saved'
+
+    def save_many(self, records):
+        if not records:
+            return 0
+        self.writer.run(lambda cursor: database.upsert_records(cursor, records))
+        return len(records)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.readers.close()
+
+
+class MySQLStorage(SQLStorage):
+    """MySQL through a mysql_pool.ConnectionPool; each operation checks out its own connection."""
+
+    name = 'mysql'
+    label = 'MySQL'
+
+    def __init__(self, pool=None):
+        super().__init__()
+        from mysql_pool import ConnectionPool
+        self.pool = pool or ConnectionPool(
+            max_size=int(os.environ.get('DB_POOL_SIZE', 5)),
+            timeout=float(os.environ.get('DB_POOL_TIMEOUT', 10))
+        )
+
+    @property
+    def errors(self):
+        # An `except storage.errors` clause only evaluates this once something was raised,
+        # so pymysql stays off the startup path
+        import pymysql
+        from mysql_pool import PoolTimeout
+        return (pymysql.err.MySQLError, PoolTimeout, OSError)
+
+    @property
+    def export_cursor_class(self):
+        # Unbuffered, so exports stream instead of loading the result client-side
+        import pymysql
+        return pymysql.cursors.SSCursor
+
+    @contextmanager
+    def connection(self):
+        with self.pool.connection() as connection:
+            yield connection
+
+    def available(self):
+        try:
+            with self.connection():
+                return True
+        except Exception:
+            return False
+
+    def _create_schema(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE DATABASE IF NOT EXISTS sra")
+        super()._create_schema(connection)
+
+    def close(self):
+        self.pool.close()
+
+
+# --- IN-MEMORY BACKEND ---
+class MemoryStorage(Storage):
+    """Keeps rows as dicts shaped like user_data rows; nothing is persisted."""
+
+    name = 'memory'
+    label = 'in-memory'
+
+    def __init__(self):
+        self._rows = {}
+        self._keys = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def setup(self):
+        pass
+
+    def _save(self, record):
+        key = (record['name'], record['email'])
+        status = 'updated' if key in self._keys else 'inserted'
+        row_id = self._keys.get(key) or self._next_id
+        if status == 'inserted':
+            self._keys[key] = row_id
+            self._next_id += 1
+        self._rows[row_id] = {
+            'ID': row_id,
+            'Name': record['name'],
+            'Email_ID': record['email'],
+            'resume_score': int(record['res_score']),
+            'Timestamp': record['timestamp'],
+            'Page_no': int(record['no_of_pages']),
+            'Predicted_Field': record['reco_field'],
+            'User_level': record['cand_level'],
+            'Actual_skills': database.encode_list(record['skills']),
+            'Recommended_skills': database.encode_list(record['recommended_skills']),
+            'Recommended_courses': database.encode_list(record['courses']),
+            '_skills': {str(skill).strip().lower() for skill in record['skills']},
+        }
+        return status
+
+    def save(self, record):
+        with self._lock:
+            return self._save(record)
+
+    def save_many(self, records):
+        with self._lock:
+            for record in records:
+                self._save(record)
+        return len(records)
+
+    def _filtered(self, filters):
+        """Filtered rows, newest first, matching admin_queries.build_where."""
+        filters = filters or {}
+        start = filters['start_date'].strftime('%Y-%m-%d 00:00:00') if filters.get('start_date') else None
+        end = ((filters['end_date'] + datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')
+               if filters.get('end_date') else None)
+        skill = filters['skill'].strip().lower() if filters.get('skill') else None
+        with self._lock:
+            rows = sorted(self._rows.values(), key=lambda row: row['ID'], reverse=True)
+        for row in rows:
+            if filters.get('field') and row['Predicted_Field'] != filters['field']:
+                continue
+            if filters.get('level') and row['User_level'] != filters['level']:
+                continue
+            if skill and skill not in row['_skills']:
+                continue
+            if filters.get('min_score') is not None and row['resume_score'] < filters['min_score']:
+                continue
+            if filters.get('max_score') is not None and row['resume_score'] > filters['max_score']:
+                continue
+            if start and str(row['Timestamp']) < start:
+                continue
+            if end and str(row['Timestamp']) >= end:
+                continue
+            yield {column: value for column, value in row.items() if column != '_skills'}
+
+    def fetch_page(self, filters=None, after_id=None, page_size=PAGE_SIZE):
+        page = []
+        for row in self._filtered(filters):
+            if after_id is not None and row['ID'] >= after_id:
+                continue
+            page.append(row)
+            if len(page) >= page_size:
+                break
+        return page
+
+    def group_counts(self, column, filters=None):
+        if column not in admin_queries.GROUPABLE_COLUMNS:
+            raise ValueError(f"Cannot group by {column}")
+        counts = {}
+        for row in self._filtered(filters):
+            counts[row[column]] = counts.get(row[column], 0) + 1
+        return sorted(counts.items(), key=lambda item: item[1], reverse=True)
+
+    def summary(self, filters=None):
+        scores = [row['resume_score'] for row in self._filtered(filters)]
+        return {'total': len(scores), 'avg_score': sum(scores) / len(scores) if scores else None}
+
+    def export(self, path, fmt='csv', filters=None):
+        def chunks():
+            rows = list(self._filtered(filters))
+            columns = list(rows[0]) if rows else ['ID'] + list(database.RECORD_COLUMNS)
+            yield columns, [tuple(row.values()) for row in rows]
+        return export.write_chunks(chunks(), path, fmt)
+
+
+def get_storage(backend=None, db_path=database.DB_PATH):
+    """Creates the storage backend named by `backend` or SRA_DB_BACKEND (default 'sqlite')."""
+    backend = (backend or os.environ.get('SRA_DB_BACKEND') or 'sqlite').lower()
+    if backend == 'sqlite':
+        return SQLiteStorage(db_path)
+    if backend == 'mysql':
+        return MySQLStorage()
+    if backend == 'memory':
+        return MemoryStorage()
+    raise ValueError(f"Unknown storage backend {backend!r}; expected one of {', '.join(BACKENDS)}")
@@ -0,0 +1,106 @@
+"""
+Synthetic resume PDFs for benchmarks, written without any PDF library.
+
+write_pdf() emits a minimal PDF 1.4 file (one Helvetica text stream per page)
+that pdfplumber reads like any other text PDF. synthetic_resume() fills it
+with a reproducible fake resume of a chosen size, page count and skill
+density, drawing skills from the taxonomy (by default the current
+skills_taxonomy.json) so the parser finds them.
+"""
+
+import random
+
+from taxonomy import get_taxonomy
+
+FILLER_WORDS = (
+    'developed', 'managed', 'team', 'project', 'delivered', 'improved', 'system', 'performance', 'customer',
+    'designed', 'implemented', 'worked', 'with', 'and', 'the', 'for', 'using', 'across', 'multiple', 'release',
+    'reduced', 'cost', 'built', 'internal', 'tools', 'led', 'migration', 'reporting', 'quality', 'review',
+    'university', 'degree', 'coursework', 'client', 'requirements', 'weekly', 'stakeholders', 'process',
+)
+SECTIONS = ('Objective', 'Projects', 'Achievements', 'Hobbies', 'Declaration')
+FIRST_NAMES = ('Asha', 'Ravi', 'Maria', 'Chen', 'Fatima', 'Lucas', 'Priya', 'Omar', 'Elena', 'Kenji')
+LAST_NAMES = ('Sharma', 'Iyer', 'Garcia', 'Wang', 'Khan', 'Silva', 'Nair', 'Haddad', 'Rossi', 'Sato')
+WORDS_PER_LINE = 12
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+
+
+def _escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(pages):
+    """Returns the bytes of a PDF with one page per list of text lines in `pages`."""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    # Each page adds a content stream and a page object; the page tree comes right after
+    pages_id = len(objects) + 2 * len(pages) + 1
+    page_ids = []
+    for lines in pages:
+        # Shrink the leading for long pages so every line stays inside the media box
+        leading = max(4, min(14, (PAGE_HEIGHT - 60) // max(1, len(lines))))
+        text = f"BT /F1 {max(3, leading - 3)} Tf 50 {PAGE_HEIGHT - 30} Td {leading} TL "
+        text += ' '.join(f"({_escape(line)}) '" for line in lines) + ' ET'
+        stream = text.encode('latin-1', 'replace')
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R /Resources << /Font << /F1 %d 0 R >> >> >>"
+            % (pages_id, PAGE_WIDTH, PAGE_HEIGHT, content, font)
+        ))
+    add(b"<< /Type /Pages /Kids [" + b' '.join(b"%d 0 R" % page_id for page_id in page_ids) + b"] /Count %d >>" % len(page_ids))
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b''.join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(out)
+
+
+def synthetic_resume(seed=0, pages=1, words_per_page=300, skill_density=0.05, skills=None):
+    """Returns the pages (lists of lines) of a reproducible fake resume.
+
+    `skill_density` is the fraction of body words replaced by a skill from
+    `skills` (default: every skill in the taxonomy; pass () for a resume
+    without skills); the first page starts with a name, contact line and
+    section headings like a real resume.
+    """
+    rng = random.Random(seed)
+    skills = list(get_taxonomy().skills if skills is None else skills)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    header = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@example.com | Phone: +91 {rng.randint(60000, 99999)} {rng.randint(10000, 99999)}",
+    ]
+    sections = rng.sample(SECTIONS, rng.randint(1, len(SECTIONS)))
+    result = []
+    for number in range(pages):
+        words = []
+        for _ in range(words_per_page):
+            if skills and rng.random() < skill_density:
+                words.append(rng.choice(skills))
+            else:
+                words.append(rng.choice(FILLER_WORDS))
+        lines = [' '.join(words[i:i + WORDS_PER_LINE]) for i in range(0, len(words), WORDS_PER_LINE)]
+        # Spread the section headings over the pages
+        headings = [f"{section}:" for section in sections[number::pages]]
+        step = max(1, len(lines) // (len(headings) + 1))
+        for offset, heading in enumerate(headings, start=1):
+            lines.insert(min(len(lines), offset * step + offset - 1), heading)
+        result.append(header + lines if number == 0 else lines)
+    return result
+
+
+def synthetic_resume_pdf(seed=0, pages=1, words_per_page=300, skill_density=0.05, skills=None):
+    """synthetic_resume() written as PDF bytes."""
+    return write_pdf(synthetic_resume(seed, pages, words_per_page, skill_density, skills))
@@ -0,0 +1,107 @@
+"""
+Skill taxonomy loaded from skills_taxonomy.json.
+
+The taxonomy is the single source for field keywords, known skills with their
+aliases, recommended skills and courses. It is parsed once into an indexed
+Taxonomy object (including a compiled SkillMatcher) and reloaded only when the
+file's modification time changes, so growing the file does not slow down
+individual requests and edits take effect without a redeploy.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from skill_matcher import SkillMatcher
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.json')
+
+
+def _fingerprint(version, raw):
+    return f"{version}-{hashlib.sha256(raw).hexdigest()[:12]}"
+
+
+class Taxonomy:
+    """Indexed, read-only view of a parsed taxonomy file."""
+
+    def __init__(self, data, fingerprint=''):
+        if not isinstance(data, dict) or not isinstance(data.get('fields'), dict):
+            raise ValueError("Taxonomy must be an object with a 'fields' mapping")
+
+        self.version = data.get('version', 0)
+        # Identifies the exact contents, for keying caches of derived results; an
+        # in-memory taxonomy is hashed as canonical JSON so two of them never share one
+        self.fingerprint = fingerprint or _fingerprint(
+            self.version, json.dumps(data, sort_keys=True, default=str).encode('utf-8'))
+
+        self.aliases = {}
+        skills = set()
+        for skill, entry in (data.get('skills') or {}).items():
+            skill = skill.lower()
+            skills.add(skill)
+            for alias in (entry or {}).get('aliases', []):
+                self.aliases[alias.lower()] = skill
+
+        self.field_keywords = {}
+        self.recommendations = {}
+        for field, entry in data['fields'].items():
+            keywords = [self.aliases.get(kw.lower(), kw.lower()) for kw in entry.get('keywords', [])]
+            skills.update(keywords)
+            self.field_keywords[field] = keywords
+            self.recommendations[field] = {
+                'skills': list(entry.get('recommended_skills', [])),
+                'courses': [list(course) for course in entry.get('courses', [])]
+            }
+
+        self.skills = sorted(skills)
+        # Inverted index: skill -> fields whose keyword list contains it
+        self.skill_fields = {}
+        for field, keywords in self.field_keywords.items():
+            for keyword in keywords:
+                self.skill_fields.setdefault(keyword, []).append(field)
+
+        self.matcher = SkillMatcher(self.skills, aliases=self.aliases)
+
+    @property
+    def fields(self):
+        return list(self.field_keywords)
+
+    def courses(self, field):
+        return self.recommendations.get(field, {}).get('courses', [])
+
+    def recommended_skills(self, field):
+        return self.recommendations.get(field, {}).get('skills', [])
+
+    @classmethod
+    def load(cls, path=TAXONOMY_PATH):
+        """Parses the taxonomy file at `path`."""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw.decode('utf-8'))
+        return cls(data, fingerprint=_fingerprint(data.get('version', 0), raw))
+
+
+def taxonomy_mtime(path=TAXONOMY_PATH):
+    """Returns the file's modification time, used to detect edits."""
+    return os.stat(path).st_mtime_ns
+
+
+_cache_lock = threading.Lock()
+_cache = {}
+
+
+def get_taxonomy(path=TAXONOMY_PATH):
+    """Returns the process-wide Taxonomy for `path`, reloading it if the file changed."""
+    mtime = taxonomy_mtime(path)
+    cached = _cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        taxonomy = Taxonomy.load(path)
+        _cache[path] = (mtime, taxonomy)
+        return taxonomy
@@ -0,0 +1,40 @@
+"""
+Tests for the analysis cache keys.
+"""
+
+import pytest
+
+import analysis_cache
+from analysis_cache import AnalysisCache, content_hash
+
+
+def test_key_starts_with_content_hash():
+    cache = AnalysisCache(cache_dir=None, namespace='App')
+    assert cache.key_for(b'%PDF', 'tax1').split('.', 1)[0] == content_hash(b'%PDF')
+
+
+def test_apps_do_not_share_entries(tmp_path):
+    app = AnalysisCache(cache_dir=str(tmp_path), namespace='App')
+    app_sqlite = AnalysisCache(cache_dir=str(tmp_path), namespace='App_SQLite')
+    app.put(app.key_for(b'%PDF', 'tax1'), {'resume_data': {'email': ''}})
+    assert app_sqlite.get(app_sqlite.key_for(b'%PDF', 'tax1')) is None
+    assert app.get(app.key_for(b'%PDF', 'tax1')) == {'resume_data': {'email': ''}}
+
+
+def test_version_bump_invalidates_disk_entries(tmp_path, monkeypatch):
+    cache = AnalysisCache(cache_dir=str(tmp_path), namespace='App')
+    cache.put(cache.key_for(b'%PDF', 'tax1'), {'resume_data': {}})
+    monkeypatch.setattr(analysis_cache, 'ANALYSIS_VERSION', analysis_cache.ANALYSIS_VERSION + 1)
+    fresh = AnalysisCache(cache_dir=str(tmp_path), namespace='App')
+    assert fresh.get(fresh.key_for(b'%PDF', 'tax1')) is None
+
+
+def test_get_returns_a_read_only_view_without_copying():
+    cache = AnalysisCache(cache_dir=None, namespace='App')
+    key = cache.key_for(b'%PDF', 'tax1')
+    cache.put(key, {'text': 'resume', 'resume_data': {'skills': ['python']}})
+    first, second = cache.get(key), cache.get(key)
+    assert first['resume_data'] is second['resume_data']
+    with pytest.raises(TypeError):
+        first['key'] = key
+    assert dict(first, key=key)['key'] == key
@@ -0,0 +1,56 @@
+"""
+Runs App_SQLite.py headless with Streamlit's AppTest and an in-memory database.
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+import metrics
+from synthetic_pdf import synthetic_resume_pdf, write_pdf
+from taxonomy import get_taxonomy
+
+
+def _app_with_upload():
+    # Runs inside AppTest: serves the PDF in session state as the uploaded file
+    import io
+    import runpy
+    import streamlit as st
+
+    pdf_data = st.session_state['pdf_data']
+    st.file_uploader = lambda *args, **kwargs: io.BytesIO(pdf_data)
+    runpy.run_path(st.session_state['app_path'], run_name='__main__')
+
+
+def run_app(pdf_data, reruns=10):
+    at = AppTest.from_function(_app_with_upload, default_timeout=60)
+    at.session_state['pdf_data'] = pdf_data
+    at.session_state['app_path'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'App_SQLite.py')
+    at.run()
+    # Reruns until the background analysis has finished
+    while reruns and any('Analyzing' in info.value for info in at.info):
+        at.run()
+        reruns -= 1
+    return at
+
+
+def test_textless_pdf_shows_warning(tmp_path, monkeypatch):
+    monkeypatch.setenv('SRA_DB_BACKEND', 'memory')
+    monkeypatch.setenv('ANALYSIS_CACHE_DIR', str(tmp_path))
+    # A blank page: no text layer, like a scanned or image-only resume
+    at = run_app(write_pdf([[]]))
+    assert not at.exception
+    assert any('No text could be extracted' in warning.value for warning in at.warning)
+
+
+def test_trace_covers_classification_and_render(tmp_path, monkeypatch):
+    monkeypatch.setenv('SRA_DB_BACKEND', 'memory')
+    monkeypatch.setenv('ANALYSIS_CACHE_DIR', str(tmp_path))
+    # Every analysis counts as slow, so its trace is kept
+    monkeypatch.setattr(metrics, 'SLOW_SECONDS', 0.0)
+    metrics.reset()
+    pdf_data = synthetic_resume_pdf(seed=3, pages=1, words_per_page=80, skills=get_taxonomy().skills[:10])
+    at = run_app(pdf_data)
+    assert not at.exception
+    stages = metrics.slow_analyses()[0].stages
+    assert {'pdf_page', 'parse_page', 'predict_field', 'render'} <= set(stages)
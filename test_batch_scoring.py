@@ -0,0 +1,34 @@
+"""
+Tests for batch_scoring against the per-resume functions.
+"""
+
+from batch_scoring import score_batch
+from resume_analysis import predict_field
+from taxonomy import Taxonomy
+
+TAXONOMY = Taxonomy({'fields': {
+    'Backend': {'keywords': ['python', 'django']},
+    'Frontend': {'keywords': ['react', 'css']},
+}})
+
+
+def test_field_is_weighted_by_skill_counts():
+    resume = {'name': 'Jane', 'skills': ['Python', 'React'], 'skill_counts': {'Python': 1, 'React': 5}}
+    # Unweighted the fields tie and the first one wins; React's five mentions decide otherwise
+    assert predict_field(resume['skills'], TAXONOMY) == 'Backend'
+    assert predict_field(resume['skill_counts'], TAXONOMY) == 'Frontend'
+    assert list(score_batch([resume], TAXONOMY)['field']) == ['Frontend']
+
+
+def test_skills_used_without_counts():
+    resumes = [{'skills': ['Python', 'React']}, {'skills': []}]
+    assert list(score_batch(resumes, TAXONOMY)['field']) == ['Backend', 'General']
+
+
+def test_in_memory_taxonomies_do_not_share_a_classifier():
+    backend = Taxonomy({'fields': {'Backend': {'keywords': ['python']}}})
+    scripting = Taxonomy({'fields': {'Scripting': {'keywords': ['python']}}})
+    assert backend.fingerprint != scripting.fingerprint
+    assert predict_field(['python'], backend) == 'Backend'
+    assert predict_field(['python'], scripting) == 'Scripting'
+    assert list(score_batch([{'skills': ['python']}], scripting)['field']) == ['Scripting']
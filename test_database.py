@@ -0,0 +1,82 @@
+"""
+Tests for migrating the baseline all-text schema with setup_database().
+"""
+
+import database
+
+BASELINE_SCHEMA = """
+    CREATE TABLE user_data (
+        ID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Name TEXT NOT NULL,
+        Email_ID TEXT NOT NULL,
+        resume_score TEXT NOT NULL,
+        Timestamp TEXT NOT NULL,
+        Page_no TEXT NOT NULL,
+        Predicted_Field TEXT NOT NULL,
+        User_level TEXT NOT NULL,
+        Actual_skills TEXT NOT NULL,
+        Recommended_skills TEXT NOT NULL,
+        Recommended_courses TEXT NOT NULL,
+        UNIQUE(Name, Email_ID)
+    )
+"""
+# What the baseline apps wrote: numbers as text and lists as str(list)
+BASELINE_ROWS = [
+    ('Jane Roe', 'jane@example.com', '85%', '2024-01-02 10:00:00', '2', 'Data Science', 'Intermediate',
+     str(['Python', 'SQL']), str(['Spark']), str([['ML Course', 'https://example.com/ml']])),
+    ('John Doe', 'john@example.com', 'n/a', '2024-01-03 11:00:00', '1', 'Web Development', 'Fresher',
+     str(['React']), str([]), str([])),
+]
+
+
+def baseline_db(path):
+    connection = database.connect(str(path))
+    connection.execute(BASELINE_SCHEMA)
+    connection.executemany(
+        "INSERT INTO user_data (Name, Email_ID, resume_score, Timestamp, Page_no, Predicted_Field, User_level, "
+        "Actual_skills, Recommended_skills, Recommended_courses) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        BASELINE_ROWS
+    )
+    connection.commit()
+    return connection
+
+
+def skills_by_candidate(connection):
+    rows = connection.execute("SELECT candidate_id, skill FROM candidate_skill ORDER BY candidate_id, skill")
+    result = {}
+    for candidate_id, skill in rows:
+        result.setdefault(candidate_id, []).append(skill)
+    return result
+
+
+def test_baseline_schema_is_migrated(tmp_path):
+    connection = baseline_db(tmp_path / 'baseline.db')
+    database.setup_database(connection)
+
+    rows = [dict(row) for row in connection.execute("SELECT * FROM user_data ORDER BY ID")]
+    assert [(row['resume_score'], row['Page_no']) for row in rows] == [(85, 2), (0, 1)]
+    assert rows[0]['Actual_skills'] == '["Python", "SQL"]'
+    assert rows[0]['Recommended_courses'] == '[["ML Course", "https://example.com/ml"]]'
+    assert skills_by_candidate(connection) == {1: ['python', 'sql'], 2: ['react']}
+
+
+def test_interrupted_migration_is_completed(tmp_path):
+    connection = baseline_db(tmp_path / 'baseline.db')
+    database.setup_database(connection)
+    # As after a MySQL run that stopped once the ALTER had auto-committed: typed
+    # columns, but lists still in str(list) form and no candidate_skill rows
+    connection.execute("DELETE FROM candidate_skill")
+    connection.execute("UPDATE user_data SET Actual_skills = ? WHERE ID = 1", (str(['Python', 'SQL']),))
+    connection.commit()
+
+    database.setup_database(connection)
+    assert connection.execute("SELECT Actual_skills FROM user_data WHERE ID = 1").fetchone()[0] == '["Python", "SQL"]'
+    assert skills_by_candidate(connection) == {1: ['python', 'sql'], 2: ['react']}
+
+
+def test_setup_is_idempotent(tmp_path):
+    connection = baseline_db(tmp_path / 'baseline.db')
+    database.setup_database(connection)
+    database.setup_database(connection)
+    assert connection.execute("SELECT COUNT(*) FROM user_data").fetchone()[0] == 2
+    assert skills_by_candidate(connection) == {1: ['python', 'sql'], 2: ['react']}
@@ -0,0 +1,63 @@
+"""
+Tests for parallel extraction in pdf_extract.
+"""
+
+import io
+import sys
+import types
+
+import pytest
+
+import metrics
+import pdf_extract
+from synthetic_pdf import synthetic_resume_pdf
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(pdf_extract, 'EXTRACT_WORKERS', 2)
+    monkeypatch.setattr(pdf_extract, 'PARALLEL_MIN_PAGES', 2)
+    monkeypatch.setattr(pdf_extract, '_executor', None)
+    monkeypatch.setattr(pdf_extract, '_parallel_disabled', False)
+    # Spawned workers re-run __main__'s file; other tests (AppTest) may leave a script there
+    monkeypatch.setitem(sys.modules, '__main__', types.ModuleType('__main__'))
+    yield
+    if pdf_extract._executor is not None:
+        pdf_extract._executor.shutdown(cancel_futures=True)
+
+
+def test_pool_is_sized_from_extract_workers(pool):
+    pdf_data = synthetic_resume_pdf(seed=1, pages=6, words_per_page=40)
+    assert len(pdf_extract.start_workers()) == 2
+    # Asking for more ranges than the pool has processes reuses the same pool
+    with pdf_extract.PageStream(io.BytesIO(pdf_data), workers=3) as stream:
+        assert stream.parallel
+        parallel = stream.extraction()
+    assert pdf_extract._executor._max_workers == 2
+    sequential = pdf_extract.extract_pdf(io.BytesIO(pdf_data))
+    assert [page.text for page in parallel.pages] == [page.text for page in sequential.pages]
+
+
+def test_parallel_extraction_is_timed_per_range(pool):
+    metrics.reset()
+    with pdf_extract.PageStream(io.BytesIO(synthetic_resume_pdf(seed=1, pages=6, words_per_page=40)), workers=3) as stream:
+        stream.extraction()
+    assert metrics.histogram('pdf_range').count == 3
+    assert metrics.histogram('pdf_page').count == 0
+
+
+def test_stopping_early_cancels_pending_ranges(pool):
+    submitted = []
+    submit_ranges = pdf_extract._submit_ranges
+
+    def recording_submit(*args):
+        submitted.extend(submit_ranges(*args))
+        return submitted
+
+    pdf_data = synthetic_resume_pdf(seed=1, pages=16, words_per_page=40)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(pdf_extract, '_submit_ranges', recording_submit)
+        with pdf_extract.PageStream(io.BytesIO(pdf_data), workers=16) as stream:
+            next(iter(stream))
+    # Two processes take at most a few queued ranges; the rest never start
+    assert sum(future.cancelled() for future in submitted) >= 8
@@ -0,0 +1,22 @@
+"""
+Tests for profiling the apps' analysis.
+"""
+
+import app_common
+import profiling
+from synthetic_pdf import synthetic_resume_pdf
+from taxonomy import get_taxonomy
+
+
+def build_page(analysis, taxonomy):
+    return {'skills': len(analysis['resume_data']['skills'])}
+
+
+def test_profile_covers_the_apps_analysis(tmp_path):
+    pdf_data = synthetic_resume_pdf(seed=2, pages=1, words_per_page=60, skills=get_taxonomy().skills[:5])
+    result, key = profiling.profile_pipeline(
+        pdf_data, lambda data: app_common.analyze_upload(data, build_page), profile_dir=str(tmp_path))
+    assert result['page'] == {'skills': len(result['resume_data']['skills'])}
+    functions = [row['function'] for row in profiling.top_functions(key, limit=None, profile_dir=str(tmp_path))]
+    assert any('build_page' in function for function in functions)
+    assert any('parse_pages' in function for function in functions)
@@ -0,0 +1,23 @@
+"""
+Tests for page-by-page resume parsing.
+"""
+
+from resume_analysis import FirstLineContactExtractor, parse_pages
+
+PAGES = ['Objective: backend work\nSkills: python, docker', 'References: on request']
+
+
+def test_app_sqlite_rules():
+    resume = parse_pages(PAGES)
+    assert resume['name'] == 'Not Found'
+    assert resume['email'] == 'Not Found'
+    assert resume['skills'] == ['Docker', 'Python']
+
+
+def test_app_rules_keep_first_line_and_empty_placeholders():
+    resume = parse_pages(PAGES, contact_extractor=FirstLineContactExtractor, title_skills=False)
+    assert resume['name'] == 'Objective: backend work'
+    # '' rather than a shared placeholder, so App.py's upsert key stays distinct per resume
+    assert resume['email'] == '' and resume['mobile_number'] == ''
+    assert resume['skills'] == ['docker', 'python']
+    assert resume['skill_counts'] == {'docker': 1, 'python': 1}
@@ -0,0 +1,16 @@
+"""
+Tests for the single-pass skill matcher.
+"""
+
+from resume_analysis import parse_resume
+from skill_matcher import SkillMatcher
+
+
+def test_unicode_case_variants_map_back_to_the_keyword():
+    matcher = SkillMatcher(['Swift', 'Kotlin'])
+    # 'ſ' (long s) and 'K' (Kelvin sign) match case-insensitively but lower() leaves them unchanged
+    assert matcher.counts('ſwift SWIFT Kotlin') == {'Swift': 2, 'Kotlin': 1}
+
+
+def test_parse_resume_survives_unicode_case_variants():
+    assert parse_resume('Jane Roe\nſwift')['skills'] == ['Swift']
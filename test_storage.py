@@ -0,0 +1,14 @@
+"""
+Tests for the storage backends' error types.
+"""
+
+import pytest
+
+from storage import SQLiteStorage
+
+
+def test_sqlite_setup_failure_is_one_of_its_errors(tmp_path):
+    storage = SQLiteStorage(db_path=str(tmp_path / 'missing' / 'resume_analyzer.db'))
+    # What App.py's setup_database catches to fall back to demo mode
+    with pytest.raises(storage.errors):
+        storage.setup()
@@ -0,0 +1,21 @@
+"""
+Tests for the synthetic resume PDFs used by the benchmarks.
+"""
+
+import io
+
+from pdf_extract import extract_pdf
+from resume_analysis import parse_resume
+from synthetic_pdf import synthetic_resume_pdf
+
+
+def parsed(pdf_data):
+    return parse_resume(extract_pdf(io.BytesIO(pdf_data)).text)
+
+
+def test_default_resume_has_taxonomy_skills():
+    assert parsed(synthetic_resume_pdf(seed=1, pages=2, words_per_page=120))['skills']
+
+
+def test_resume_without_skills():
+    assert parsed(synthetic_resume_pdf(seed=1, pages=2, words_per_page=120, skills=()))['skills'] == []